@@ -31,7 +31,7 @@ cd ../backend_apis
 pip3 install -r requirements.txt
 
 # Start the server
-uvicorn main:app --reload
+uvicorn main:app --reload --loop uvloop --http httptools
 
 # Cleanup
 deactivate
@@ -14,19 +14,28 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from fastapi import FastAPI, Body, HTTPException, status, Request
+from fastapi import FastAPI, Body, Depends, HTTPException, status, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from dataplexutils.metadata.client import Client
 from dataplexutils.metadata.client_options import ClientOptions
+from dataplexutils.metadata.dataplex_operations import _utc_now_iso
 from dataplexutils.metadata.version import __version__
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
+from functools import cached_property
 import logging
-import datetime
-import traceback
-from pydantic import ValidationError
+import threading
+import time
 import json
-import uuid
+import orjson
 from google.cloud import dataplex_v1
 import toml
 import pkgutil
@@ -37,9 +46,59 @@ constants = toml.loads(pkgutil.get_data("dataplexutils.metadata", "constants.tom
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+class ErrorLoggingRoute(APIRoute):
+    """Route class turning unhandled endpoint errors into logged 500 responses.
+
+    Registered once for the whole app so endpoints do not need their own
+    try/except blocks. HTTP and request validation errors pass through.
+    """
+
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def error_logging_route_handler(request: Request):
+            try:
+                return await route_handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.exception("Unhandled error in %s %s", request.method, request.url.path)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+                )
+
+        return error_logging_route_handler
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+app.router.route_class = ErrorLoggingRoute
+
+# Size of the thread pool used to run the blocking Client calls off the event loop
+BLOCKING_CALLS_MAX_WORKERS = 64
+# Maximum number of short Client calls (reviews, reads, marks) in flight at once
+BLOCKING_CALLS_MAX_CONCURRENCY = 16
+# Maximum number of description generations in flight at once. Generations run for
+# minutes and fan out to max_workers threads each, so they get their own, smaller
+# limit and never hold the slots of the short calls.
+GENERATION_CALLS_MAX_CONCURRENCY = 4
+# Upper bound of ClientOptionsSettings.max_workers, capping each generation's fan-out
+GENERATION_MAX_WORKERS_LIMIT = 32
+_blocking_calls_semaphore = asyncio.Semaphore(BLOCKING_CALLS_MAX_CONCURRENCY)
+_generation_calls_semaphore = asyncio.Semaphore(GENERATION_CALLS_MAX_CONCURRENCY)
+
+async def run_blocking(func, *args, **kwargs):
+    """Runs a short blocking Client call in the executor, bounded by the short calls semaphore."""
+    async with _blocking_calls_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+async def run_generation(func, *args, **kwargs):
+    """Runs a description generation in the executor, bounded by the generations semaphore."""
+    async with _generation_calls_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
 
 class ClientOptionsSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     use_lineage_tables: bool
     use_lineage_processes: bool
     use_profile: bool
@@ -50,37 +109,57 @@ class ClientOptionsSettings(BaseModel):
     top_values_in_description: bool
     description_handling: str
     description_prefix: str
+    max_workers: int = Field(10, ge=1, le=GENERATION_MAX_WORKERS_LIMIT)
 
 
 class ClientSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     project_id: str
     llm_location: str
     dataplex_location: str
 
 
 class TableSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     project_id: str
     dataset_id: str
     table_id: str
     documentation_uri: str | None = None
 
+    @cached_property
+    def fqn(self) -> str:
+        return f"{self.project_id}.{self.dataset_id}.{self.table_id}"
+
 class DatasetSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     project_id: str
     dataset_id: str | None = None
     documentation_csv_uri: str
     strategy: str
 
-class ColumnSettings(BaseModel):
+    @cached_property
+    def fqn(self) -> str:
+        return f"{self.project_id}.{self.dataset_id}"
+
+# Plain dataclasses for the bodies that need no validation beyond their shape
+@dataclass(slots=True)
+class ColumnSettings:
     column_name: str
 
-class RegenerationCounts(BaseModel):
+@dataclass(slots=True)
+class RegenerationCounts:
     tables: int
     columns: int
 
-class RegenerationRequest(BaseModel):
+@dataclass(slots=True)
+class RegenerationRequest:
     objects: list[str]
 
-class MarkForRegenerationRequest(BaseModel):
+@dataclass(slots=True)
+class MarkForRegenerationRequest:
     table_fqn: str
     column_name: str | None = None
 
@@ -101,6 +180,92 @@ class AddNegativeExampleRequest(BaseModel):
     table_settings: TableSettings
     example: str
 
+@functools.lru_cache(maxsize=128)
+def _client_options_kwargs(client_options_settings: ClientOptionsSettings) -> dict:
+    return client_options_settings.model_dump()
+
+def _to_client_options(client_options_settings: ClientOptionsSettings) -> ClientOptions:
+    # A new ClientOptions per call: regeneration mutates the options it is given
+    return ClientOptions(**_client_options_kwargs(client_options_settings))
+
+# Serializes first construction so concurrent threads do not build duplicate clients
+_client_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=128)
+def _build_cached_client(client_settings: ClientSettings, client_options_settings: ClientOptionsSettings | None) -> Client:
+    return Client(
+        project_id=client_settings.project_id,
+        llm_location=client_settings.llm_location,
+        dataplex_location=client_settings.dataplex_location,
+        client_options=_to_client_options(client_options_settings) if client_options_settings else None
+    )
+
+def _get_cached_client(client_settings: ClientSettings, client_options_settings: ClientOptionsSettings | None) -> Client:
+    with _client_cache_lock:
+        return _build_cached_client(client_settings, client_options_settings)
+
+def get_client(client_settings: ClientSettings, client_options_settings: ClientOptionsSettings | None = None) -> Client:
+    """Returns a Client shared by all requests with the same settings.
+
+    Clients hold the gRPC channels to BigQuery, Dataplex and Lineage, so they
+    are built once per settings combination instead of once per request.
+    Endpoints that mutate the client options must build their own Client.
+    """
+    return _get_cached_client(client_settings, client_options_settings)
+
+def client_dep(client_settings: ClientSettings = Body()) -> Client:
+    return get_client(client_settings)
+
+def client_with_options_dep(
+    client_settings: ClientSettings = Body(),
+    client_options_settings: ClientOptionsSettings = Body(),
+) -> Client:
+    return get_client(client_settings, client_options_settings)
+
+
+# Only the beginning of a request body is logged at DEBUG level
+LOGGED_BODY_MAX_BYTES = 1024
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware that logs incoming HTTP requests.
+
+    The request body is never buffered; when DEBUG logging is enabled the
+    first LOGGED_BODY_MAX_BYTES of the body are logged as the application
+    reads them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logger.info("Request: %s %s", scope["method"], scope["path"])
+        if not logger.isEnabledFor(logging.DEBUG):
+            await self.app(scope, receive, send)
+            return
+
+        logger.debug("Headers: %s", scope["headers"])
+        logged_body_bytes = 0
+
+        async def logging_receive():
+            nonlocal logged_body_bytes
+            message = await receive()
+            if message["type"] == "http.request" and logged_body_bytes < LOGGED_BODY_MAX_BYTES:
+                chunk = message.get("body", b"")[:LOGGED_BODY_MAX_BYTES - logged_body_bytes]
+                if chunk:
+                    logged_body_bytes += len(chunk)
+                    logger.debug("Body[:%d]: %s", LOGGED_BODY_MAX_BYTES, chunk)
+            return message
+
+        await self.app(scope, logging_receive, send)
+
+
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allow all origins for debugging
@@ -110,17 +275,24 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def configure_blocking_executor():
+    """Installs a dedicated executor for the blocking Client calls made via run_blocking."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_CALLS_MAX_WORKERS)
+    )
+
+
 @app.get("/version")
-def read_version():
+async def read_version():
     return {"version": __version__}
 
 
 @app.post("/generate_table_description")
-def generate_table_description(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def generate_table_description(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
  
     """
@@ -136,82 +308,31 @@ def generate_table_description(
             message if something goes wrong.
 
     """
-    try:
-        print("Client options class definition: ",ClientOptions.__dict__)
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            top_values_in_description=client_options_settings.top_values_in_description,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=client_options
-        )
-        table_fqn = f"{table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}"
-        logger.info(f"Received arguments: {client_options_settings}, {client_settings}, {table_settings}")
-        logger.info(f"Generating for table: {table_fqn}")
-        client.generate_table_description(table_fqn,table_settings.documentation_uri)
-        return {
-            "message": "Table description generated successfully"
-           
-        }
-    except Exception as e:
-        logger.exception("An error occurred while generating table descriptions") 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-        )
+    table_fqn = table_settings.fqn
+    logger.info("Received arguments: %r, %r", client._client_options, table_settings)
+    logger.info("Generating for table: %s", table_fqn)
+    await run_generation(client.generate_table_description, table_fqn, table_settings.documentation_uri)
+    return {
+        "message": "Table description generated successfully"
+       
+    }
 
 @app.post("/generate_columns_descriptions")
-def generate_columns_descriptions(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def generate_columns_descriptions(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
-    try:
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            top_values_in_description=client_options_settings.top_values_in_description,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=client_options
-        )
 
-        table_fqn = f"{table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}"
-        client.generate_columns_descriptions(table_fqn, table_settings.documentation_uri)
-        return {"message": "Column descriptions generated successfully"}
-    except Exception as e:
-        logger.exception("An error occurred while generating column descriptions") 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-        )
+    table_fqn = table_settings.fqn
+    await run_generation(client.generate_columns_descriptions, table_fqn, table_settings.documentation_uri)
+    return {"message": "Column descriptions generated successfully"}
 
 @app.post("/generate_dataset_tables_descriptions")
-def generate_dataset_tables_descriptions(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def generate_dataset_tables_descriptions(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
     """
         Generates a table description in Dataplex using the provided settings.
@@ -226,45 +347,19 @@ def generate_dataset_tables_descriptions(
             message if something goes wrong.
     
     """
-    try:
-        logger.debug("Generating dataset tables request")
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            top_values_in_description=client_options_settings.top_values_in_description,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,        
-            client_options=client_options,
-            
-        )
+    logger.debug("Generating dataset tables request")
 
-        dataset_fqn = f"{dataset_settings.project_id}.{dataset_settings.dataset_id}"
-        logger.info(f"Received arguments: {client_options_settings}, {client_settings}, {dataset_settings}")
-        logger.info(f"Generating for dataset: {dataset_fqn}")
-        client.generate_dataset_tables_descriptions(dataset_fqn,dataset_settings.strategy,dataset_settings.documentation_csv_uri)
-        return {"message": "Dataset table descriptions generated successfully"}
-    except Exception as e:
-        logger.exception("An error occurred while generating dataset descriptions") 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-        )
+    dataset_fqn = dataset_settings.fqn
+    logger.info("Received arguments: %r, %r", client._client_options, dataset_settings)
+    logger.info("Generating for dataset: %s", dataset_fqn)
+    await run_generation(client.generate_dataset_tables_descriptions, dataset_fqn, dataset_settings.strategy, dataset_settings.documentation_csv_uri)
+    return {"message": "Dataset table descriptions generated successfully"}
 
 @app.post("/generate_dataset_tables_columns_descriptions")
-def generate_dataset_tables_columns_descriptions(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def generate_dataset_tables_columns_descriptions(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
     """
         Generates a table description in Dataplex using the provided settings.
@@ -279,44 +374,19 @@ def generate_dataset_tables_columns_descriptions(
             message if something goes wrong.
     
     """
-    try:
-        logger.debug("Generating dataset tables request")
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            top_values_in_description=client_options_settings.top_values_in_description,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,        
-            client_options=client_options,            
-        )
+    logger.debug("Generating dataset tables request")
 
-        dataset_fqn = f"{dataset_settings.project_id}.{dataset_settings.dataset_id}"
-        logger.info(f"Received arguments: {client_options_settings}, {client_settings}, {dataset_settings}")
-        logger.info(f"Generating for dataset: {dataset_fqn}")
-        client.generate_dataset_tables_columns_descriptions(dataset_fqn,dataset_settings.strategy,dataset_settings.documentation_csv_uri)
-        return {"message": "Dataset table columns descriptions generated successfully"}
-    except Exception as e:
-        logger.exception("An error occurred while generating dataset descriptions") 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-        )
+    dataset_fqn = dataset_settings.fqn
+    logger.info("Received arguments: %r, %r", client._client_options, dataset_settings)
+    logger.info("Generating for dataset: %s", dataset_fqn)
+    await run_generation(client.generate_dataset_tables_columns_descriptions, dataset_fqn, dataset_settings.strategy, dataset_settings.documentation_csv_uri)
+    return {"message": "Dataset table columns descriptions generated successfully"}
 
 @app.post("/accept_table_draft_description")
-def accept_table_draft_description(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def accept_table_draft_description(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
     """
     Accepts the draft description for a table, promoting it to the actual table description.
@@ -329,82 +399,55 @@ def accept_table_draft_description(
     Returns:
         A message indicating success or failure.
     """
-    try:
-        logger.info("=== START: accept_table_draft_description ===")
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=client_options
-        )
+    table_fqn = table_settings.fqn
+    logger.info("Accepting draft description for table: %s", table_fqn)
+    
+    now = _utc_now_iso()
 
-        table_fqn = f"{table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}"
-        logger.info(f"Accepting draft description for table: {table_fqn}")
-        
-        # Get existing comments and negative examples
-        existing_comments = client.get_comments_to_table_draft_description(table_fqn) or []
-        existing_negative_examples = client.get_negative_examples_to_table_draft_description(table_fqn) or []
-        
-        # First, update the aspect metadata to mark it as accepted
-        # Only use fields that are defined in the aspect template
-        aspect_content = {
-            "certified": "true",
-            "user-who-certified": "system",  # You might want to pass the actual user from the frontend
-            "contents": client._review_ops.get_review_item_details(table_fqn)["draftDescription"],
-            "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "to-be-regenerated": "false",
-            "human-comments": existing_comments,  # Preserve existing comments
-            "negative-examples": existing_negative_examples,  # Preserve existing negative examples
-            "external-document-uri": table_settings.documentation_uri if hasattr(table_settings, 'documentation_uri') else "",
-            "is-accepted": True,
-            "when-accepted": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-        }
-        
-        # Update the aspect with the new metadata
-        success = client._dataplex_ops.update_table_draft_description(
-            table_fqn=table_fqn,
-            description=aspect_content["contents"],
-            metadata=aspect_content
-        )
-        
-        if not success:
-            raise Exception("Failed to update aspect metadata")
-        
-        # Then promote the draft description to the actual description
-        client.accept_table_draft_description(table_fqn)
-        
-        logger.info("Draft description accepted and metadata updated successfully")
-        return {"message": "Table draft description accepted successfully"}
-    except Exception as e:
-        logger.error("=== ERROR in accept_table_draft_description ===")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error message: {str(e)}")
-        logger.error(f"Traceback:\n{traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
-            detail=str(e)
-        )
-    finally:
-        logger.info("=== END: accept_table_draft_description ===")
+    # Get existing draft description, comments and negative examples
+    draft_description, existing_comments, existing_negative_examples = await run_blocking(
+        client.get_review_state, table_fqn
+    )
+    draft_description = draft_description or ""
+    
+    # First, update the aspect metadata to mark it as accepted
+    # Only use fields that are defined in the aspect template
+    aspect_content = {
+        "certified": True,
+        "user-who-certified": "system",  # You might want to pass the actual user from the frontend
+        "contents": draft_description,
+        "generation-date": now,
+        "to-be-regenerated": False,
+        "human-comments": existing_comments,  # Preserve existing comments
+        "negative-examples": existing_negative_examples,  # Preserve existing negative examples
+        "external-document-uri": table_settings.documentation_uri if hasattr(table_settings, 'documentation_uri') else "",
+        "is-accepted": True,
+        "when-accepted": now
+    }
+    
+    # Update the aspect with the new metadata
+    success = await run_blocking(
+        client._dataplex_ops.update_table_draft_description,
+        table_fqn=table_fqn,
+        description=aspect_content["contents"],
+        metadata=aspect_content
+    )
+    
+    if not success:
+        raise Exception("Failed to update aspect metadata")
+    
+    # Then promote the draft description to the actual description
+    await run_blocking(client.accept_table_draft_description, table_fqn)
+    
+    logger.info("Draft description accepted and metadata updated successfully")
+    return ORJSONResponse(content={"message": "Table draft description accepted successfully"})
 
 @app.post("/accept_column_draft_description")
-def accept_column_draft_description(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def accept_column_draft_description(
     table_settings: TableSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
-    column_settings: ColumnSettings = Body()
+    column_settings: ColumnSettings = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
     """
     Accepts the draft description for a column, promoting it to the actual column description.
@@ -418,115 +461,96 @@ def accept_column_draft_description(
     Returns:
         A message indicating success or failure.
     """
-    try:
-        client_options = ClientOptions(
-            use_lineage_tables=client_options_settings.use_lineage_tables,
-            use_lineage_processes=client_options_settings.use_lineage_processes,
-            use_profile=client_options_settings.use_profile,
-            use_data_quality=client_options_settings.use_data_quality,
-            use_ext_documents=client_options_settings.use_ext_documents,
-            persist_to_dataplex_catalog=client_options_settings.persist_to_dataplex_catalog,
-            stage_for_review=client_options_settings.stage_for_review,
-            description_handling=client_options_settings.description_handling,
-            description_prefix=client_options_settings.description_prefix
-        )
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=client_options
-        )
 
-        table_fqn = f"{table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}"
-        logger.info(f"Accepting draft description for column {column_settings.column_name} in table: {table_fqn}")
-        client.accept_column_draft_description(table_fqn, column_settings.column_name)
-        return {"message": f"Column {column_settings.column_name} draft description accepted successfully"}
-    except Exception as e:
-        logger.exception("An error occurred while accepting column draft description") 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
-        )
+    table_fqn = table_settings.fqn
+    logger.info("Accepting draft description for column %s in table: %s", column_settings.column_name, table_fqn)
+    await run_blocking(client.accept_column_draft_description, table_fqn, column_settings.column_name)
+    return ORJSONResponse(content={"message": f"Column {column_settings.column_name} draft description accepted successfully"})
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(f"HTTP error occurred: {exc.detail}")
-    return JSONResponse(
+    logger.error("HTTP error occurred: %s", exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
     )
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Request: {request.method} {request.url}")
-    logger.debug(f"Headers: {request.headers}")
-    body = await request.body()
-    logger.debug(f"Body: {body.decode()}")
-    response = await call_next(request)
-    return response
-
 # Regeneration Management APIs
+REGENERATION_COUNTS_TTL_SECONDS = 30
+REGENERATION_COUNTS_CACHE_MAX_SIZE = 1024
+# (project_id, dataplex_location, dataset_fqn) -> (expires_at, tables_count)
+_regeneration_tables_count_cache = {}
+
+def _cache_regeneration_tables_count(cache_key, tables_count):
+    """Keeps a dataset's regeneration count, evicting expired counts when the cache is full."""
+    now = time.monotonic()
+    if len(_regeneration_tables_count_cache) >= REGENERATION_COUNTS_CACHE_MAX_SIZE:
+        for key in [key for key, (expires_at, _) in _regeneration_tables_count_cache.items() if expires_at <= now]:
+            del _regeneration_tables_count_cache[key]
+        if len(_regeneration_tables_count_cache) >= REGENERATION_COUNTS_CACHE_MAX_SIZE:
+            _regeneration_tables_count_cache.clear()
+    _regeneration_tables_count_cache[cache_key] = (now + REGENERATION_COUNTS_TTL_SECONDS, tables_count)
+
+def _invalidate_regeneration_tables_counts(table_fqns):
+    """Drops the cached regeneration counts of the datasets of some tables."""
+    dataset_fqns = {table_fqn.rsplit(".", 1)[0] for table_fqn in table_fqns}
+    for key in [key for key in _regeneration_tables_count_cache if key[2] in dataset_fqns]:
+        del _regeneration_tables_count_cache[key]
+
 @app.post("/get_regeneration_counts")
-def get_regeneration_counts(
+async def get_regeneration_counts(
     client_settings: ClientSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
     search_query: str = Body(None),
 ):
-    try:
-        # Validate required parameters
-        if not client_settings.project_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="project_id is required"
-            )
-        if not client_settings.llm_location:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="llm_location is required"
-            )
-        if not client_settings.dataplex_location:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="dataplex_location is required"
-            )
-        if not dataset_settings.project_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="dataset_project_id is required"
-            )
-            
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
+    # Validate required parameters
+    if not client_settings.project_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="project_id is required"
         )
-        
-        dataset_fqn = f"{dataset_settings.project_id}.{dataset_settings.dataset_id}" 
-        logger.info(f"Getting regeneration counts for dataset: {dataset_fqn}")
-        
-        # Use _list_tables_in_dataset_for_regeneration to get tables marked for regeneration
-        tables = client._table_ops._list_tables_in_dataset_for_regeneration(dataset_fqn)
-        tables_count = len(tables)
-        
-        logger.info(f"Found {tables_count} tables marked for regeneration")
-        
-        return RegenerationCounts(
-            tables=tables_count,
-            columns=0  # TODO: Implement column counting
+    if not client_settings.llm_location:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="llm_location is required"
         )
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_regeneration_counts: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    if not client_settings.dataplex_location:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="dataplex_location is required"
         )
+    if not dataset_settings.project_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="dataset_project_id is required"
+        )
+        
+    client = get_client(client_settings)
+    
+    dataset_fqn = dataset_settings.fqn 
+    logger.info("Getting regeneration counts for dataset: %s", dataset_fqn)
+    
+    # The UI polls this endpoint, so the listing is reused for a few seconds
+    cache_key = (client_settings.project_id, client_settings.dataplex_location, dataset_fqn)
+    cached = _regeneration_tables_count_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        tables_count = cached[1]
+    else:
+        # Use _list_tables_in_dataset_for_regeneration to get tables marked for regeneration
+        tables = await run_blocking(client._table_ops._list_tables_in_dataset_for_regeneration, dataset_fqn)
+        tables_count = len(tables)
+        _cache_regeneration_tables_count(cache_key, tables_count)
+    
+    logger.info("Found %s tables marked for regeneration", tables_count)
+    
+    return ORJSONResponse(content=RegenerationCounts(
+        tables=tables_count,
+        columns=0  # TODO: Implement column counting
+    ))
 
 # Add a GET endpoint for backward compatibility
 @app.get("/get_regeneration_counts")
-def get_regeneration_counts_get(
+async def get_regeneration_counts_get(
     project_id: str,
     llm_location: str,
     dataplex_location: str,
@@ -534,7 +558,7 @@ def get_regeneration_counts_get(
     dataset_id: str,
     search_query: str = None,
 ):
-    logger.info(f"GET request received for get_regeneration_counts, converting to POST format")
+    logger.info("GET request received for get_regeneration_counts, converting to POST format")
     
     # Create the objects expected by the POST endpoint
     client_settings = ClientSettings(
@@ -551,110 +575,91 @@ def get_regeneration_counts_get(
     )
     
     # Call the POST endpoint handler
-    return get_regeneration_counts(
+    return await get_regeneration_counts(
         client_settings=client_settings,
         dataset_settings=dataset_settings,
         search_query=search_query
     )
 
 @app.post("/regenerate_selected")
-def regenerate_selected(
-    client_options_settings: ClientOptionsSettings = Body(),
-    client_settings: ClientSettings = Body(),
+async def regenerate_selected(
     dataset_settings: DatasetSettings = Body(),
     regeneration_request: RegenerationRequest = Body(),
+    client: Client = Depends(client_with_options_dep),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=ClientOptions(**client_options_settings.dict())
-        )
-        
-        dataset_fqn = f"{dataset_settings.project_id}.{dataset_settings.dataset_id}"
-        search_query = regeneration_request.objects[0] if regeneration_request.objects else None
-        
-        logger.info(f"Processing regeneration for dataset: {dataset_fqn} with filter: {search_query}")
-        
-        # Use the utility method to build the effective query
-        # This ensures the dataset_fqn is always included in the query
-        effective_query = client._review_ops.build_search_query_for_regeneration(dataset_fqn, search_query)
-        logger.info(f"Final query for review items: {effective_query}")
-        
-        # Get all items matching the pattern
-        matching_items = client._review_ops.get_review_items_for_dataset(dataset_fqn, effective_query)
-        items = matching_items.get("data", {}).get("items", [])
-        
-        logger.info(f"Found {len(items)} items matching filter")
+    dataset_fqn = dataset_settings.fqn
+    search_query = regeneration_request.objects[0] if regeneration_request.objects else None
+    
+    logger.info("Processing regeneration for dataset: %s with filter: %s", dataset_fqn, search_query)
+    
+    # Use the utility method to build the effective query
+    # This ensures the dataset_fqn is always included in the query
+    effective_query = client._review_ops.build_search_query_for_regeneration(dataset_fqn, search_query)
+    logger.info("Final query for review items: %s", effective_query)
+    
+    # Get all items matching the pattern
+    matching_items = await run_blocking(client._review_ops.get_review_items_for_dataset, dataset_fqn, effective_query)
+    items = matching_items.get("data", {}).get("items", [])
+    
+    logger.info("Found %s items matching filter", len(items))
+    
+    results = []
+    for item in items:
+        item_name = item.get("name", "")
+        logger.info("Regenerating item: %s", item_name)
         
-        results = []
-        for item in items:
-            item_name = item.get("name", "")
-            logger.info(f"Regenerating item: {item_name}")
-            
-            # TODO: Implement actual regeneration logic here
-            # This is a placeholder - you'll need to implement the actual regeneration
-            # based on your application's requirements
-            
-            results.append({"object": item_name, "status": "regenerated"})
+        # TODO: Implement actual regeneration logic here
+        # This is a placeholder - you'll need to implement the actual regeneration
+        # based on your application's requirements
         
-        return {"regenerated_objects": results}
-    except Exception as e:
-        logger.error(f"Error in regenerate_selected: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+        results.append({"object": item_name, "status": "regenerated"})
+    
+    return ORJSONResponse(content={"regenerated_objects": results})
 
 @app.post("/regenerate_all")
-def regenerate_all(
+async def regenerate_all(
     client_options_settings: ClientOptionsSettings = Body(),
     client_settings: ClientSettings = Body(),
     dataset_settings: DatasetSettings = Body(),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-            client_options=ClientOptions(**client_options_settings.dict())
-        )
-        
-        dataset_fqn = f"{dataset_settings.project_id}.{dataset_settings.dataset_id}"
-        logger.info(f"Regenerating all marked items in dataset: {dataset_fqn}")
-        
-        # Set regeneration flag to True
-        client._client_options._regenerate = True
-        
-        # Call generate_dataset_tables_columns_descriptions with regeneration flag
-        result = client.regenerate_dataset_tables_columns_descriptions(
-            dataset_fqn=dataset_fqn,
-            strategy=dataset_settings.strategy,
-            documentation_csv_uri=dataset_settings.documentation_csv_uri
-        )
-        
-        # Reset regeneration flag
-        client._client_options._regenerate = False
-        
-        return {"message": "All marked items (tables and columns) regenerated successfully"}
-    except Exception as e:
-        logger.error(f"Error in regenerate_all: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    # Regeneration flips flags on the client options, so this endpoint
+    # uses its own Client instead of the shared one from get_client
+    client = Client(
+        project_id=client_settings.project_id,
+        llm_location=client_settings.llm_location,
+        dataplex_location=client_settings.dataplex_location,
+        client_options=_to_client_options(client_options_settings)
+    )
+    
+    dataset_fqn = dataset_settings.fqn
+    logger.info("Regenerating all marked items in dataset: %s", dataset_fqn)
+    
+    # Set regeneration flag to True
+    client._client_options._regenerate = True
+    
+    # Call generate_dataset_tables_columns_descriptions with regeneration flag
+    result = await run_generation(
+        client.regenerate_dataset_tables_columns_descriptions,
+        dataset_fqn=dataset_fqn,
+        strategy=dataset_settings.strategy,
+        documentation_csv_uri=dataset_settings.documentation_csv_uri
+    )
+    
+    # Reset regeneration flag
+    client._client_options._regenerate = False
+    
+    return ORJSONResponse(content={"message": "All marked items (tables and columns) regenerated successfully"})
 
 # Review Management Models
-class Comment(BaseModel):
+@dataclass(slots=True)
+class Comment:
     id: str
     text: str
     type: str
     timestamp: str
 
-class MetadataItem(BaseModel):
+@dataclass(slots=True)
+class MetadataItem:
     id: str
     type: str
     name: str
@@ -666,189 +671,205 @@ class MetadataItem(BaseModel):
     comments: list[Comment]
     markedForRegeneration: bool = False
 
+def _orjson_dumps(content) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+async def _stream_review_items(response_data):
+    """Yields the review items response as JSON, one item per chunk."""
+    yield b'{"items":['
+    for index, item in enumerate(response_data["items"]):
+        if index:
+            yield b","
+        yield _orjson_dumps(item)
+    yield (
+        b'],"nextPageToken":' + _orjson_dumps(response_data["nextPageToken"])
+        + b',"totalCount":' + _orjson_dumps(response_data["totalCount"]) + b"}"
+    )
+
 # Review Management APIs
+async def _fetch_review_items(client: Client, dataset_settings: DatasetSettings) -> dict:
+    """Returns the review items of a dataset in the response structure of /metadata/review."""
+    # Only validate project_id
+    if not dataset_settings.project_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="project_id must be provided"
+        )
+
+    try:
+        # Get all review items for the project, optionally filtered by dataset
+        logger.info("Getting review items for project %s", dataset_settings.project_id)
+
+        result = await run_blocking(client._review_ops.get_review_items_for_dataset, dataset_fqn=dataset_settings.dataset_id)
+        logger.debug("Raw result from review_ops: %s", result)
+
+        # Ensure we always return a properly structured response
+        if not isinstance(result, dict):
+            result = {"items": [], "nextPageToken": None, "totalCount": 0}
+
+        # If result has a "data" wrapper, unwrap it
+        if isinstance(result, dict) and "data" in result:
+            result = result["data"]
+
+        # Ensure all required fields are present
+        response_data = {
+            "items": result.get("items", []),
+            "nextPageToken": result.get("nextPageToken", None),
+            "totalCount": result.get("totalCount", len(result.get("items", [])))
+        }
+
+        logger.debug("Structured response data: %s", response_data)
+        return response_data
+
+    except Exception as e:
+        logger.error("Error getting review items: %s", e)
+        return {
+            "items": [],
+            "nextPageToken": None,
+            "totalCount": 0
+        }
+
+def _review_items_etag(dataset_settings: DatasetSettings, response_data: dict) -> str:
+    last_modified = max((item.get("lastModified") or "" for item in response_data["items"]), default="")
+    fingerprint = f"{dataset_settings.fqn}|{last_modified}|{response_data['totalCount']}"
+    return '"' + hashlib.sha1(fingerprint.encode()).hexdigest() + '"'
+
 @app.post("/metadata/review")
-def get_review_items(
-    client_settings: ClientSettings = Body(),
+async def get_review_items(
     dataset_settings: DatasetSettings = Body(),
+    client: Client = Depends(client_dep),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        # Only validate project_id
-        if not dataset_settings.project_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="project_id must be provided"
-            )
-        
-        try:
-            # Get all review items for the project, optionally filtered by dataset
-        
-            
-            logger.info(f"Getting review items for project {dataset_settings.project_id}")
-                
-            result = client._review_ops.get_review_items_for_dataset(dataset_fqn=dataset_settings.dataset_id)
-            logger.info(f"Raw result from review_ops: {result}")
-            
-            # Ensure we always return a properly structured response
-            if not isinstance(result, dict):
-                result = {"items": [], "nextPageToken": None, "totalCount": 0}
-            
-            # If result has a "data" wrapper, unwrap it
-            if isinstance(result, dict) and "data" in result:
-                result = result["data"]
-            
-            # Ensure all required fields are present
-            response_data = {
-                "items": result.get("items", []),
-                "nextPageToken": result.get("nextPageToken", None),
-                "totalCount": result.get("totalCount", len(result.get("items", [])))
-            }
-            
-            logger.info(f"Structured response data: {response_data}")
-            return response_data
-            
-        except Exception as e:
-            logger.error(f"Error getting review items: {str(e)}")
-            return {
-                "items": [],
-                "nextPageToken": None,
-                "totalCount": 0
-            }
-            
-    except Exception as e:
-        logger.error(f"Error in get_review_items: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    response_data = await _fetch_review_items(client, dataset_settings)
+    return StreamingResponse(
+        _stream_review_items(response_data),
+        media_type="application/json"
+    )
+
+@app.get("/metadata/review")
+async def get_review_items_get(
+    request: Request,
+    project_id: str,
+    llm_location: str,
+    dataplex_location: str,
+    dataset_project_id: str,
+    dataset_id: str = None,
+):
+    """Query-parameter variant of /metadata/review supporting conditional requests.
+
+    The response carries an ETag derived from the dataset and the most recent
+    lastModified of its items; a matching If-None-Match gets a 304.
+    """
+    client = get_client(ClientSettings(
+        project_id=project_id,
+        llm_location=llm_location,
+        dataplex_location=dataplex_location
+    ))
+    dataset_settings = DatasetSettings(
+        project_id=dataset_project_id,
+        dataset_id=dataset_id,
+        documentation_csv_uri="",  # Required by the model but not used for this endpoint
+        strategy=""  # Required by the model but not used for this endpoint
+    )
+    response_data = await _fetch_review_items(client, dataset_settings)
+    etag = _review_items_etag(dataset_settings, response_data)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return StreamingResponse(
+        _stream_review_items(response_data),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 @app.post("/metadata/review/{id}/reject")
-def reject_review_item(
+async def reject_review_item(
     id: str,
-    client_settings: ClientSettings = Body(),
+    client: Client = Depends(client_dep),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        result = client.reject_review_item(id)
-        return {"status": "rejected", "id": id, **result}
-    except Exception as e:
-        logger.error(f"Error in reject_review_item: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    result = await run_blocking(client.reject_review_item, id)
+    # Rejecting marks the item for regeneration; ids are "table:<fqn>" or "column:<fqn>:<column>"
+    _invalidate_regeneration_tables_counts(id.split(":")[1:2])
+    return {"status": "rejected", "id": id, **result}
 
 @app.post("/metadata/review/{id}/edit")
-def edit_review_item(
+async def edit_review_item(
     id: str,
-    client_settings: ClientSettings = Body(),
     description: str = Body(..., embed=True),
+    client: Client = Depends(client_dep),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        result = client.edit_review_item(id, description)
-        return {"status": "updated", "id": id, **result}
-    except Exception as e:
-        logger.error(f"Error in edit_review_item: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    result = await run_blocking(client.edit_review_item, id, description)
+    return {"status": "updated", "id": id, **result}
 
 @app.post("/metadata/review/{id}/comment")
-def add_review_comment(
+async def add_review_comment(
     id: str,
-    client_settings: ClientSettings = Body(),
     comment: str = Body(..., embed=True),
+    client: Client = Depends(client_dep),
 ):
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        # TODO: Implement comment logic
-        return {
-            "status": "added",
-            "id": id,
-            "comment": {
-                "id": "new_comment_id",
-                "text": comment,
-                "type": "human",
-                "timestamp": datetime.datetime.now().isoformat()
-            }
+    # TODO: Implement comment logic
+    return {
+        "status": "added",
+        "id": id,
+        "comment": {
+            "id": "new_comment_id",
+            "text": comment,
+            "type": "human",
+            "timestamp": _utc_now_iso()
         }
-    except Exception as e:
-        logger.error(f"Error in add_review_comment: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    }
 
 @app.post("/mark_for_regeneration")
-def mark_for_regeneration(
-    client_settings: ClientSettings = Body(),
+async def mark_for_regeneration(
     request: MarkForRegenerationRequest = Body(),
+    client: Client = Depends(client_dep),
 ):
     """Mark a table or column for regeneration.
 
     If column_name is provided, marks the specific column for regeneration.
     If only table_fqn is provided, marks the entire table for regeneration.
     """
-    try:
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        if request.column_name:
-            success = client.mark_column_for_regeneration(request.table_fqn, request.column_name)
-            if success:
-                return {"message": f"Column {request.column_name} in table {request.table_fqn} marked for regeneration"}
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to mark column {request.column_name} for regeneration"
-                )
+    if request.column_name:
+        success = await run_blocking(client.mark_column_for_regeneration, request.table_fqn, request.column_name)
+        _invalidate_regeneration_tables_counts([request.table_fqn])
+        if success:
+            return {"message": f"Column {request.column_name} in table {request.table_fqn} marked for regeneration"}
         else:
-            success = client.mark_table_for_regeneration(request.table_fqn)
-            if success:
-                return {"message": f"Table {request.table_fqn} marked for regeneration"}
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to mark table {request.table_fqn} for regeneration"
-                )
-    except Exception as e:
-        logger.error(f"Error in mark_for_regeneration: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to mark column {request.column_name} for regeneration"
+            )
+    else:
+        success = await run_blocking(client.mark_table_for_regeneration, request.table_fqn)
+        _invalidate_regeneration_tables_counts([request.table_fqn])
+        if success:
+            return {"message": f"Table {request.table_fqn} marked for regeneration"}
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to mark table {request.table_fqn} for regeneration"
+            )
+
+@app.post("/mark_for_regeneration_batch")
+async def mark_for_regeneration_batch(
+    objects: list[MarkForRegenerationRequest] = Body(),
+    client: Client = Depends(client_dep),
+):
+    """Mark several tables and/or columns for regeneration in one call.
+
+    Objects of the same table are written with a single Dataplex update, and
+    the tables are updated concurrently.
+    """
+    results = await run_blocking(
+        client.mark_objects_for_regeneration,
+        [(obj.table_fqn, obj.column_name) for obj in objects]
+    )
+    _invalidate_regeneration_tables_counts([obj.table_fqn for obj in objects])
+    return ORJSONResponse(content={"marked_objects": results})
 
 @app.post("/metadata/review/details")
-def get_review_item_details(
-    client_settings: ClientSettings = Body(),
+async def get_review_item_details(
     table_settings: TableSettings = Body(),
     column_name: str = Body(None),
+    client: Client = Depends(client_dep),
 ):
     """Get detailed information about a review item.
     
@@ -860,113 +881,72 @@ def get_review_item_details(
     Returns:
         Detailed information about the review item
     """
-    try:
-        logger.info(f"Getting details for table: {table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}")
-        if column_name:
-            logger.info(f"Column: {column_name}")
-        
-        client = Client(
-            project_id=client_settings.project_id,
-            llm_location=client_settings.llm_location,
-            dataplex_location=client_settings.dataplex_location,
-        )
-        
-        table_fqn = f"{table_settings.project_id}.{table_settings.dataset_id}.{table_settings.table_id}"
-        
-        if column_name:
-            # Get column details
-            details = client.get_review_item_details(table_fqn, column_name)
-        else:
-            # Get table details
-            details = client.get_review_item_details(table_fqn)
-            
-        if not details:
-            raise ValueError(f"No details found for {'column ' + column_name if column_name else 'table'} {table_fqn}")
-        
-        # Return the details directly without wrapping in data field
-        return details
+    logger.info("Getting details for table: %s", table_settings.fqn)
+    if column_name:
+        logger.info("Column: %s", column_name)
+    
+    table_fqn = table_settings.fqn
+    
+    if column_name:
+        # Get column details
+        details = await run_blocking(client.get_review_item_details, table_fqn, column_name)
+    else:
+        # Get table details
+        details = await run_blocking(client.get_review_item_details, table_fqn)
+        
+    if not details:
+        raise ValueError(f"No details found for {'column ' + column_name if column_name else 'table'} {table_fqn}")
+    
+    # Return the details directly without wrapping in data field
+    return details
 
-    except Exception as e:
-        logger.error(f"Error getting review item details for table {table_fqn} column {column_name}: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
 
 @app.post("/update_table_draft_description")
-async def update_table_draft_description(request: Request, update_request: UpdateDraftDescriptionRequest):
+async def update_table_draft_description(update_request: UpdateDraftDescriptionRequest):
     """Update the draft description for a table.
     
     Args:
-        request: The raw request object for logging
         update_request: Request containing client settings, table settings, and the new description
     
     Returns:
         A dictionary with the status of the update operation
     """
-    try:
-        # Log the raw request body
-        body = await request.body()
-        logger.info("=== START: update_table_draft_description ===")
-        logger.info(f"Raw request body: {body.decode()}")
-        logger.info(f"Parsed request: {update_request.dict()}")
-        
-        client = Client(
-            project_id=update_request.client_settings.project_id,
-            llm_location=update_request.client_settings.llm_location,
-            dataplex_location=update_request.client_settings.dataplex_location
-        )
-        
-        # Construct the table FQN
-        table_fqn = f"{update_request.table_settings.project_id}.{update_request.table_settings.dataset_id}.{update_request.table_settings.table_id}"
-        logger.info(f"Constructed table FQN: {table_fqn}")
-        
-        # Update the draft description
-        logger.info(f"Updating draft description. Length: {len(update_request.description)}")
-        logger.info(f"Is HTML: {update_request.is_html}")
-        
-        success = client._dataplex_ops.update_table_draft_description(
-            table_fqn=table_fqn,
-            description=update_request.description
-        )
-        
-        if success:
-            logger.info("Draft description updated successfully")
-            return {
-                "status": "success",
-                "message": "Draft description updated successfully"
-            }
-        else:
-            logger.error("Failed to update draft description (returned False)")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to update draft description"
-            )
-        
-    except ValidationError as e:
-        # Log validation errors in detail
-        logger.error("=== Validation Error ===")
-        logger.error(f"Error details: {e.errors()}")
-        logger.error(f"Error JSON: {e.json()}")
-        raise HTTPException(
-            status_code=422,
-            detail=f"Validation error: {str(e)}"
-        )
-    except Exception as e:
-        logger.error("=== Error in update_table_draft_description ===")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error message: {str(e)}")
-        logger.error(f"Traceback:\n{traceback.format_exc()}")
+    # The raw body is logged by RequestLoggingMiddleware at DEBUG level
+    logger.debug("=== START: update_table_draft_description ===")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Parsed request: %s", update_request.model_dump())
+    
+    client = get_client(update_request.client_settings)
+    
+    # Construct the table FQN
+    table_fqn = update_request.table_settings.fqn
+    logger.info("Constructed table FQN: %s", table_fqn)
+    
+    # Update the draft description
+    logger.info("Updating draft description. Length: %s", len(update_request.description))
+    logger.info("Is HTML: %s", update_request.is_html)
+    
+    success = await run_blocking(
+        client._dataplex_ops.update_table_draft_description,
+        table_fqn=table_fqn,
+        description=update_request.description
+    )
+    
+    if not success:
+        logger.error("Failed to update draft description (returned False)")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to update draft description: {str(e)}"
+            detail="Failed to update draft description"
         )
-    finally:
-        logger.info("=== END: update_table_draft_description ===")
+    
+    logger.info("Draft description updated successfully")
+    return {
+        "status": "success",
+        "message": "Draft description updated successfully"
+    }
 
 @app.post("/metadata/review/add_comment")
-def add_comment(request: AddCommentRequest):
+async def add_comment(request: AddCommentRequest):
     """Add a comment to a table or column's draft description.
     
     Args:
@@ -975,44 +955,29 @@ def add_comment(request: AddCommentRequest):
     Returns:
         The newly added comment text
     """
-    try:
-        logger.info("=== START: add_comment ===")
-        client = Client(
-            project_id=request.client_settings.project_id,
-            llm_location=request.client_settings.llm_location,
-            dataplex_location=request.client_settings.dataplex_location,
-        )
-        
-        table_fqn = f"{request.table_settings.project_id}.{request.table_settings.dataset_id}.{request.table_settings.table_id}"
-        logger.info(f"Adding comment to table: {table_fqn}")
-        
-        if request.column_name:
-            success = client.add_comment_to_column_draft_description(table_fqn, request.column_name, request.comment)
-        else:
-            success = client.add_comment_to_table_draft_description(table_fqn, request.comment)
-            
-        if not success:
-            logger.error("Failed to add comment")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to add comment"
-            )
-            
-        logger.info("Comment added successfully")
-        return {"comment": request.comment}
+    client = get_client(request.client_settings)
+    
+    table_fqn = request.table_settings.fqn
+    logger.info("Adding comment to table: %s", table_fqn)
+    
+    if request.column_name:
+        success = await run_blocking(client.add_comment_to_column_draft_description, table_fqn, request.column_name, request.comment)
+    else:
+        success = await run_blocking(client.add_comment_to_table_draft_description, table_fqn, request.comment)
         
-    except Exception as e:
-        logger.error(f"Error adding comment: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    if not success:
+        logger.error("Failed to add comment")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
+            detail="Failed to add comment"
         )
-    finally:
-        logger.info("=== END: add_comment ===")
+        
+    logger.info("Comment added successfully")
+    return {"comment": request.comment}
+    
 
 @app.post("/metadata/review/add_negative_example")
-def add_negative_example(request: AddNegativeExampleRequest):
+async def add_negative_example(request: AddNegativeExampleRequest):
     """Add a negative example to a table's draft description.
     
     Args:
@@ -1021,46 +986,37 @@ def add_negative_example(request: AddNegativeExampleRequest):
     Returns:
         The newly added negative example text
     """
-    try:
-        client = Client(
-            project_id=request.client_settings.project_id,
-            llm_location=request.client_settings.llm_location,
-            dataplex_location=request.client_settings.dataplex_location,
-        )
-        
-        table_fqn = f"{request.table_settings.project_id}.{request.table_settings.dataset_id}.{request.table_settings.table_id}"
-        
-        # Get existing aspect
-        existing_comments = client.get_comments_to_table_draft_description(table_fqn) or []
-        existing_negative_examples = client.get_negative_examples_to_table_draft_description(table_fqn) or []
-        
-        # Add to existing examples
-        existing_negative_examples.append(request.example)
-        
-        # Update aspect with new metadata
-        aspect_content = {
-            "negative-examples": existing_negative_examples,
-            "human-comments": existing_comments
-        }
-        
-        success = client._dataplex_ops.update_table_draft_description(
-            table_fqn=table_fqn,
-            description=client._review_ops.get_review_item_details(table_fqn)["draftDescription"],
-            metadata=aspect_content
-        )
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to add negative example"
-            )
-            
-        return {"example": request.example}
-        
-    except Exception as e:
-        logger.error(f"Error adding negative example: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    client = get_client(request.client_settings)
+    
+    table_fqn = request.table_settings.fqn
+    
+    # Appends to the stored examples with a single read and a single update
+    success = await run_blocking(
+        client.add_negative_example_to_table_draft_description, table_fqn, request.example
+    )
+    
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
+            detail="Failed to add negative example"
         )
+        
+    return {"example": request.example}
+    
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        backlog=4096,
+        # Keep connections open longer than the load balancer's idle timeout
+        timeout_keep_alive=75,
+        # Answer 503 instead of queueing once this many requests are in flight
+        limit_concurrency=256,
+    )
@@ -1,10 +1,9 @@
-from airflow import DAG
-from airflow.operators.python import PythonOperator,BranchPythonOperator
+from airflow.decorators import dag, task
 from airflow.utils.dates import days_ago
 import random
 import logging
+import functools
 from google.cloud import storage
-import json
 import sys
 from airflow.utils.edgemodifier import Label
 
@@ -24,7 +23,14 @@ location ="us-central1"
 project_id = "garciaam-670-20240123092619"
 dataset_name = "customer_data_product"
 table_name = "customer_data"
-client = Client(
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """Returns the metadata wizard client, built on first use.
+
+    The scheduler imports this file on every parse, so the client (and its
+    gRPC channels and credentials) is only created inside task processes.
+    """
+    return Client(
             project_id=project_id,
             llm_location=location,
             dataplex_location=location,
@@ -33,53 +39,59 @@ client = Client(
 
 contract_validation_reports_bucket = "dataplex-utils"
 
+@functools.lru_cache(maxsize=None)
+def get_storage_client():
+    """Returns a storage client shared by all tasks run in this worker process."""
+    return storage.Client()
+
 # Dummy functions for demonstration purposes
 def get_data_product_status(table):
     print("Getting product status from aspect")
-    status = client._data_product_ops.get_product_status(table)
+    status = get_client()._data_product_ops.get_product_status(table)
     print (status)
     return status
 
-def create_documentation(**context):
+# The table and contract are passed between tasks as TaskFlow arguments
+# instead of explicit xcom_push / xcom_pull calls
+
+@task(task_id='create_docs')
+def create_documentation(table):
     logger.info("Creating documentation...")
-    table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
-    description = client.generate_table_description(table)
+    description = get_client().generate_table_description(table)
     logger.debug(f"Documentation created {description}")
 
-def attach_mandatory_contract_tags(**context):
+@task
+def attach_mandatory_contract_tags(table, contract):
     """Simulates attaching mandatory tags."""
     print("Attaching mandatory tags...")
-    table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
-    contract = context['ti'].xcom_pull(task_ids='create_contract_aspect_types', key='conract_json')
-    #client.create_contract_aspects_types(contract,table)
-    client.initialize_contract_aspect_product(contract,table) 
+    #get_client().create_contract_aspects_types(contract,table)
+    get_client().initialize_contract_aspect_product(contract,table) 
 
-def mark_to_review(**context):
+@task
+def mark_to_review(table):
     """Simulates attaching mandatory tags."""
     
     logger.info("Update product status to to-review")
-    table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
-    description = client.update_product_status(table, "to-be-reviewed")
+    description = get_client().update_product_status(table, "to-be-reviewed")
 
 
-def create_contract_aspect_types(**context):
-    table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
-    contract = client._data_product_ops.get_contract(table)
+@task
+def create_contract_aspect_types(table):
+    contract = get_client()._data_product_ops.get_contract(table)
     logger.info(f"Using contract {contract}")
-    client.create_contract_aspects_types(contract,table)
+    get_client().create_contract_aspects_types(contract,table)
     logger.info(f"Apect types to support contract created {contract}")
-    context['ti'].xcom_push(key='conract_json', value=contract)
+    return contract
 
 
-def validate_contract(**context):
-    table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
-    contract = client._data_product_ops.get_contract(table)
+@task.branch
+def validate_contract(table):
+    contract = get_client()._data_product_ops.get_contract(table)
     logger.info(f"validating contract for table  : {table} based on json contract {contract}")
-    report = client.validate_contract_aspects(contract,table)
+    report = get_client().validate_contract_aspects(contract,table)
     logger.info(f"Validation report : {report}")
 
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(contract_validation_reports_bucket)
+    bucket = get_storage_client().bucket(contract_validation_reports_bucket)
     file_name = table.replace('.', '-')
     destination_blob_name= f"report/contract_validation_report { file_name}.json"
     blob = bucket.blob(destination_blob_name)
@@ -89,38 +101,35 @@ def validate_contract(**context):
     logger.info("Validation report uplaoded to  gs://{bucket}/{destination_blob_name} ")
     return "invalid_product"
 
-    data = json.loads(report)
-    if "field_validation" in json_data:
-        for item in json_data["field_validation"]:
-            if "value" in item and item["value"] == "false":
-                return "invalid_product"
-    return "share_data_product"
-
 
-def validate_data_product_status_and_process(**context):
+@task(task_id='validate_status')
+def validate_data_product_status_and_process():
     """Validates the data product status and triggers appropriate tasks."""
     project_id = "garciaam-670-20240123092619"
     table= f"{project_id}.merchants_data_product.core_merchants"
-    context['ti'].xcom_push(key='table', value=table)
     logger.info(f"Validating table {table}")
+    return table
     
     
-def waitting_manual_validation(**context):
+@task
+def waitting_manual_validation():
     logger.info("Waitting for manual validation and status to be updated to 'to-be-publushed'")
  
-def invalid_product(**context):
+@task
+def invalid_product():
     logger.info("Error product not valid send email to owner! ")
  
 
-def share_data_product(**context):
+@task
+def share_data_product(table):
     logger.info("TODO update IAM tag")
-    data_product_status = get_data_product_status()
+    data_product_status = get_data_product_status(table)
     print(f"Data product status: {data_product_status}")
-    context['ti'].xcom_push(key='data_product_status', value=data_product_status)
+    return data_product_status
 
-def branch_tasks(**context):
+@task.branch(task_id='branching')
+def branch_tasks(table):
         """Branches the pipeline based on the data product status."""
-        table = context['ti'].xcom_pull(task_ids='validate_status', key='table')
         logger.info(table)
         print (table)
 
@@ -136,7 +145,7 @@ def branch_tasks(**context):
         else:
             return None #Or a different task for validated products, if needed.
 
-with DAG(
+@dag(
     dag_id='data_product_validation_pipeline',
     default_args={
         'owner': 'airflow',
@@ -147,78 +156,20 @@ with DAG(
     schedule_interval=None,  # Run manually or trigger externally
     catchup=False,
     tags=['data_validation'],
-) as dag:
-    
-    validate_status = PythonOperator(
-        task_id='validate_status',
-        python_callable=validate_data_product_status_and_process,
-        provide_context=True,
-    )
-
-
-    create_docs = PythonOperator(
-        task_id='create_docs',
-        python_callable=create_documentation,
-        provide_context=True,
-
-    )
-
-    attach_mandatory_contract_tags = PythonOperator(
-        task_id='attach_mandatory_contract_tags',
-        python_callable=attach_mandatory_contract_tags,
-        provide_context=True,
-
-    )
+)
+def data_product_validation_pipeline():
+    table = validate_data_product_status_and_process()
+    branching = branch_tasks(table)
 
-    create_contract_aspect_types = PythonOperator(
-        task_id='create_contract_aspect_types',
-        python_callable=create_contract_aspect_types,
-        provide_context=True,
-    )
+    create_docs = create_documentation(table)
+    contract = create_contract_aspect_types(table)
+    attach_tags = attach_mandatory_contract_tags(table, contract)
+    validate = validate_contract(table)
+    waitting = waitting_manual_validation()
 
-    validate_contract = BranchPythonOperator(
-        task_id='validate_contract',
-        python_callable=validate_contract,
-        provide_context=True,
+    branching >> [create_docs, validate, waitting]
+    create_docs >> contract >> attach_tags >> mark_to_review(table)
+    validate >> [invalid_product(), share_data_product(table)]
 
-    )
 
-    share_data_product = PythonOperator(
-        task_id='share_data_product',
-        python_callable=share_data_product,
-        provide_context=True,
-
-    )
-    
-    mark_to_review = PythonOperator(
-        task_id='mark_to_review',
-        python_callable=mark_to_review,
-        provide_context=True,
-
-    )
-
-    waitting_manual_validation = PythonOperator(
-        task_id='waitting_manual_validation',
-        python_callable=waitting_manual_validation,
-        provide_context=True,
-
-    )
-
-    invalid_product = PythonOperator(
-        task_id='invalid_product',
-        python_callable=invalid_product,
-        provide_context=True,
-
-    )
-
-    branching = BranchPythonOperator(
-        task_id='branching',
-        python_callable=branch_tasks,
-        provide_context=True,
-    )
-    
-    validate_status >> branching
-    branching >> [create_docs,validate_contract,waitting_manual_validation]
-    create_docs >> create_contract_aspect_types >> attach_mandatory_contract_tags >> mark_to_review
-    validate_contract >> [invalid_product,share_data_product]
-    
\ No newline at end of file
+data_product_validation_pipeline()
@@ -20,10 +20,11 @@ limitations under the License.
 import logging
 import toml
 import pkgutil
+import threading
+import time
 
 # Cloud imports
 from google.cloud.exceptions import NotFound
-from google.cloud import bigquery
 from google.api_core.exceptions import BadRequest, Forbidden
 
 # Load constants
@@ -32,12 +33,41 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Table metadata read for prompts is reused for this long; writes through this class drop it
+_TABLE_CACHE_TTL_SECONDS = 60
+_TABLE_CACHE_MAX_SIZE = 1024
+
 class BigQueryOperations:
     """BigQuery-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        # table_fqn -> (expiry, bigquery.Table)
+        self._table_cache = {}
+        self._table_cache_lock = threading.Lock()
+
+    def _get_table(self, table_fqn):
+        """Returns the BigQuery table, reusing a read from the last _TABLE_CACHE_TTL_SECONDS.
+
+        The returned table is shared between callers and must not be modified.
+        """
+        now = time.monotonic()
+        with self._table_cache_lock:
+            cached = self._table_cache.get(table_fqn)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        table = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(table_fqn)
+        with self._table_cache_lock:
+            if len(self._table_cache) >= _TABLE_CACHE_MAX_SIZE:
+                self._table_cache.clear()
+            self._table_cache[table_fqn] = (now + _TABLE_CACHE_TTL_SECONDS, table)
+        return table
+
+    def _invalidate_cached_table(self, table_fqn):
+        """Drops the cached table after it was updated."""
+        with self._table_cache_lock:
+            self._table_cache.pop(table_fqn, None)
 
     def table_exists(self, table_fqn: str) -> None:
         """Checks if a specified BigQuery table exists.
@@ -50,7 +80,7 @@ class BigQueryOperations:
             NotFound: If the specified table does not exist.
         """
         try:
-            self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(table_fqn)
+            self._get_table(table_fqn)
         except NotFound:
             logger.error(f"Table {table_fqn} is not found.")
             raise NotFound(message=f"Table {table_fqn} is not found.")
@@ -72,9 +102,7 @@ class BigQueryOperations:
             Exception: If there is an error retrieving the schema.
         """
         try:
-            table = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(
-                table_fqn
-            )
+            table = self._get_table(table_fqn)
             schema_fields = table.schema
             flattened_schema = [
                 {"name": field.name, "type": field.field_type}
@@ -149,7 +177,7 @@ class BigQueryOperations:
         """
         try:
             project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = bigquery.Client(project=project_id)
+            client = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]]
             table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
             
             # Get existing description and format the new one
@@ -162,6 +190,7 @@ class BigQueryOperations:
             
             table.description = combined_description
             client.update_table(table, ["description"])
+            self._invalidate_cached_table(table_fqn)
             
             logger.info(f"Updated description for table {table_fqn}")
             return True
@@ -185,7 +214,7 @@ class BigQueryOperations:
         """
         try:
             project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = bigquery.Client(project=project_id)
+            client = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]]
             table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
             
             schema = list(table.schema)
@@ -203,6 +232,7 @@ class BigQueryOperations:
             
             table.schema = schema
             client.update_table(table, ["schema"])
+            self._invalidate_cached_table(table_fqn)
             
             logger.info(f"Updated description for column {column_name} in table {table_fqn}")
             return True
@@ -229,6 +259,7 @@ class BigQueryOperations:
             _ = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].update_table(
                 table, ["schema"]
             )
+            self._invalidate_cached_table(table_fqn)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e 
\ No newline at end of file
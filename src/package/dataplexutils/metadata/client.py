@@ -19,7 +19,11 @@ limitations under the License.
 from .version import __version__
 
 # Standard library imports
+import asyncio
+import itertools
 import logging
+import threading
+import weakref
 import toml
 import pkgutil
 
@@ -45,6 +49,23 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+class _CatalogClientPool:
+    """Spreads Dataplex catalog calls round-robin over several clients.
+
+    Each client has its own gRPC channel and HTTP/2 connection, so concurrent
+    calls are not limited by the stream limit of a single connection. Attribute
+    access is forwarded to the next client, so callers use the pool exactly like
+    a CatalogServiceClient.
+    """
+
+    def __init__(self, clients):
+        self._clients = clients
+        self._next_index = itertools.count()
+
+    def __getattr__(self, name):
+        # next() on itertools.count is atomic, so threads need no lock
+        return getattr(self._clients[next(self._next_index) % len(self._clients)], name)
+
 class Client:
     """Represents the main metadata wizard client."""
 
@@ -69,8 +90,11 @@ class Client:
             constants["CLIENTS"]["BIGQUERY"]: bigquery.Client(),
             constants["CLIENTS"]["DATAPLEX_DATA_SCAN"]: dataplex_v1.DataScanServiceClient(),
             constants["CLIENTS"]["DATA_CATALOG_LINEAGE"]: datacatalog_lineage_v1.LineageClient(),
-            constants["CLIENTS"]["DATAPLEX_CATALOG"]: dataplex_v1.CatalogServiceClient()
+            constants["CLIENTS"]["DATAPLEX_CATALOG"]: self._create_catalog_client()
         }
+        # Async catalog clients, one per event loop (see _get_async_catalog_client)
+        self._async_catalog_clients = weakref.WeakKeyDictionary()
+        self._async_catalog_clients_lock = threading.Lock()
 
         # Initialize operation classes
         self._utils = MetadataUtils(self)
@@ -81,6 +105,42 @@ class Client:
         self._review_ops = ReviewOperations(self)
         self._data_product_ops = DataProductOperations(self)
 
+    def _create_catalog_client(self):
+        """Creates the Dataplex catalog client on a pool of channels tuned for concurrent calls.
+
+        CHANNEL_POOL_SIZE channels are built with the options from the GRPC section
+        of the constants, on top of the unlimited message sizes the default
+        transport uses, and calls are spread over them round-robin.
+        """
+        transport_class = dataplex_v1.services.catalog_service.transports.CatalogServiceGrpcTransport
+        clients = []
+        for _ in range(constants["GRPC"]["CHANNEL_POOL_SIZE"]):
+            channel = transport_class.create_channel(
+                options=[
+                    ("grpc.max_send_message_length", -1),
+                    ("grpc.max_receive_message_length", -1),
+                    ("grpc.keepalive_time_ms", constants["GRPC"]["KEEPALIVE_TIME_MS"]),
+                    ("grpc.keepalive_timeout_ms", constants["GRPC"]["KEEPALIVE_TIMEOUT_MS"]),
+                    ("grpc.use_local_subchannel_pool", constants["GRPC"]["USE_LOCAL_SUBCHANNEL_POOL"]),
+                ]
+            )
+            clients.append(dataplex_v1.CatalogServiceClient(transport=transport_class(channel=channel)))
+        return _CatalogClientPool(clients)
+
+    def _get_async_catalog_client(self):
+        """Returns the async Dataplex catalog client of the running event loop.
+
+        The async client binds its gRPC channel to the loop that first uses it, so
+        each event loop gets its own client. Clients are created lazily from a
+        coroutine and dropped together with their loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_catalog_clients_lock:
+            client = self._async_catalog_clients.get(loop)
+            if client is None:
+                client = dataplex_v1.CatalogServiceAsyncClient()
+                self._async_catalog_clients[loop] = client
+            return client
 
     # Delegate all operations to appropriate operation classes
     def generate_dataset_tables_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
@@ -110,9 +170,15 @@ class Client:
     def get_negative_examples_to_table_draft_description(self, table_fqn):
         return self._review_ops.get_negative_examples_to_table_draft_description(table_fqn)
 
+    def get_review_state(self, table_fqn):
+        return self._review_ops.get_review_state(table_fqn)
+
     def add_comment_to_table_draft_description(self, table_fqn, comment):
         return self._review_ops.add_comment_to_table_draft_description(table_fqn, comment)
 
+    def add_negative_example_to_table_draft_description(self, table_fqn, example):
+        return self._review_ops.add_negative_example_to_table_draft_description(table_fqn, example)
+
     def add_comment_to_column_draft_description(self, table_fqn, column_name, comment):
         return self._review_ops.add_comment_to_column_draft_description(table_fqn, column_name, comment)
 
@@ -125,6 +191,12 @@ class Client:
     def mark_column_for_regeneration(self, table_fqn: str, column_name: str):
         return self._dataplex_ops.mark_column_for_regeneration(table_fqn, column_name)
 
+    def mark_objects_for_regeneration(self, objects):
+        return self._dataplex_ops.mark_objects_for_regeneration(objects)
+
+    def bulk_update_table_draft_descriptions(self, items):
+        return self._dataplex_ops.bulk_update_table_draft_descriptions(items)
+
     def generate_dataset_tables_columns_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         return self._column_ops.generate_dataset_tables_columns_descriptions(dataset_fqn, strategy, documentation_csv_uri)
 
@@ -140,6 +212,12 @@ class Client:
     def create_product_description(self, table_fqn):
         return self._data_product_ops.create_product_description(table_fqn)
 
+    def create_product_description_from_ids(self, project_id, dataset_id, table_id):
+        return self._data_product_ops.create_product_description_from_ids(project_id, dataset_id, table_id)
+
+    async def acreate_product_description(self, table_fqn):
+        return await self._data_product_ops.acreate_product_description(table_fqn)
+
     def create_contract_aspects_types(self,json_data, table_fqn):
         return self._data_product_ops.create_contract_aspects_types(json_data, table_fqn)
 
@@ -153,3 +231,15 @@ class Client:
     def update_product_status(self, table_fqn, status):
         return self._data_product_ops.update_product_status(table_fqn,status)
 
+    def bulk_update_product_status(self, updates):
+        return self._data_product_ops.bulk_update_product_status(updates)
+
+    async def aget_contract(self, table_fqn):
+        return await self._data_product_ops.aget_contract(table_fqn)
+
+    async def aupdate_product_status(self, table_fqn, status):
+        return await self._data_product_ops.aupdate_product_status(table_fqn, status)
+
+    async def avalidate_contract_aspects(self, json_contract, table_fqn):
+        return await self._data_product_ops.avalidate_contract(json_contract, table_fqn)
+
@@ -21,7 +21,8 @@ class ClientOptions:
         regenerate=False,
         top_values_in_description=True,
         description_handling=constants["DESCRIPTION_HANDLING"]["APPEND"],
-        description_prefix=constants["OUTPUT_CLAUSES"]["AI_WARNING"]
+        description_prefix=constants["OUTPUT_CLAUSES"]["AI_WARNING"],
+        max_workers=10
     ):
         self._use_lineage_tables = use_lineage_tables
         self._use_lineage_processes = use_lineage_processes
@@ -36,6 +37,8 @@ class ClientOptions:
         self._top_values_in_description = top_values_in_description
         self._description_handling = description_handling
         self._description_prefix = description_prefix
+        # Tables described concurrently by dataset-level generation
+        self._max_workers = max_workers
         
     def to_dict(self):
         """Convert the ClientOptions object to a dictionary."""
@@ -52,7 +55,8 @@ class ClientOptions:
             "regenerate": self._regenerate,
             "top_values_in_description": self._top_values_in_description,
             "description_handling": self._description_handling,
-            "description_prefix": self._description_prefix
+            "description_prefix": self._description_prefix,
+            "max_workers": self._max_workers
         }
     
     def __str__(self):
@@ -33,6 +33,12 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+_NAIVE = constants["GENERATION_STRATEGY"]["NAIVE"]
+_DOCUMENTED = constants["GENERATION_STRATEGY"]["DOCUMENTED"]
+_DOCUMENTED_THEN_REST = constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]
+_RANDOM = constants["GENERATION_STRATEGY"]["RANDOM"]
+_ALPHABETICAL = constants["GENERATION_STRATEGY"]["ALPHABETICAL"]
+
 class ColumnOperations:
     """Column-specific operations."""
 
@@ -90,52 +96,55 @@ class ColumnOperations:
             if int_strategy not in constants["GENERATION_STRATEGY"].values():
                 raise ValueError(f"Invalid strategy: {strategy}.")
             
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            if int_strategy == _DOCUMENTED:
                 if documentation_csv_uri is None:
                     raise ValueError("A documentation URI is required for the DOCUMENTED strategy.")
 
             # Get tables in dataset
             if self._client._client_options._regenerate:
                 tables = self._client._table_ops._list_tables_in_dataset_for_regeneration(dataset_fqn)
-                logger.debug(f"Tables to regenerate columns: {tables}")
+                logger.debug("Tables to regenerate columns: %s", tables)
             else:
                 tables = self._client._table_ops._list_tables_in_dataset(dataset_fqn)
-                logger.debug(f"Tables to generate columns: {tables}")
+                logger.debug("Tables to generate columns: %s", tables)
+            # Membership checks against the documentation CSV use sets; tables keeps the listing order
+            tables_set = set(tables)
+            tables_metadata = self._client._table_ops._prefetch_tables_metadata(tables)
             
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            if int_strategy == _DOCUMENTED:
                 tables_from_uri = self._client._table_ops._get_tables_from_uri(documentation_csv_uri)
                 for table in tables_from_uri:
-                    if table[0] not in tables:
+                    if table[0] not in tables_set:
                         raise ValueError(f"Table {table[0]} not found in dataset {dataset_fqn}.")
                     # Generate columns for this table
-                    self.generate_columns_descriptions(table[0], table[1])
+                    self.generate_columns_descriptions(table[0], table[1], table_metadata=tables_metadata.get(table[0]))
 
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]:
+            if int_strategy == _DOCUMENTED_THEN_REST:
                 tables_from_uri = self._client._table_ops._get_tables_from_uri(documentation_csv_uri)
                 for table in tables_from_uri:
-                    if table[0] not in tables:
+                    if table[0] not in tables_set:
                         raise ValueError(f"Table {table[0]} not found in dataset {dataset_fqn}.")
                     # Generate columns for this table
-                    self.generate_columns_descriptions(table[0], table[1])
-                    self._client._table_ops.generate_table_description(table[0])
+                    self.generate_columns_descriptions(table[0], table[1], table_metadata=tables_metadata.get(table[0]))
+                    self._client._table_ops.generate_table_description(table[0], table_metadata=tables_metadata.get(table[0]))
 
-                tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
+                tables_from_uri_first_elements = {table[0] for table in tables_from_uri}
                 for table in tables:
                     if table not in tables_from_uri_first_elements:
-                        self.generate_columns_descriptions(table)
-                        self._client._table_ops.generate_table_description(table)
+                        self.generate_columns_descriptions(table, table_metadata=tables_metadata.get(table))
+                        self._client._table_ops.generate_table_description(table, table_metadata=tables_metadata.get(table))
             
-            if int_strategy in [constants["GENERATION_STRATEGY"]["NAIVE"], constants["GENERATION_STRATEGY"]["RANDOM"], constants["GENERATION_STRATEGY"]["ALPHABETICAL"]]:
+            if int_strategy in (_NAIVE, _RANDOM, _ALPHABETICAL):
                 tables_sorted = self._client._table_ops._order_tables_to_strategy(tables, int_strategy)
                 for table in tables_sorted:
-                    self.generate_columns_descriptions(table)
-                    self._client._table_ops.generate_table_description(table)
+                    self.generate_columns_descriptions(table, table_metadata=tables_metadata.get(table))
+                    self._client._table_ops.generate_table_description(table, table_metadata=tables_metadata.get(table))
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
-    def generate_columns_descriptions(self, table_fqn, documentation_uri=None, human_comments=None):
+    def generate_columns_descriptions(self, table_fqn, documentation_uri=None, human_comments=None, table_metadata=None):
         """Generates metadata on the columns.
 
         Args:
@@ -143,6 +152,7 @@ class ColumnOperations:
             (e.g., 'project.dataset.table')
             documentation_uri: Optional URI to documentation
             human_comments: Optional human comments to consider
+            table_metadata: Optional prefetched quality, profile and lineage bundle
 
         Returns:
             None.
@@ -151,34 +161,20 @@ class ColumnOperations:
             NotFound: If the specified table does not exist.
         """
         try:
-            logger.info(f"Generating metadata for columns in table {table_fqn}.")
+            logger.info("Generating metadata for columns in table %s.", table_fqn)
             self._client._bigquery_ops.table_exists(table_fqn)
             table_schema_str, table_schema = self._client._bigquery_ops.get_table_schema(table_fqn)
             table_sample = self._client._bigquery_ops.get_table_sample(
                 table_fqn, constants["DATA"]["NUM_ROWS_TO_SAMPLE"]
             )
 
-            # Get additional information
-            table_quality = self._client._dataplex_ops.get_table_quality(
-                self._client._client_options._use_data_quality, table_fqn
-            )
-            table_profile = self._client._dataplex_ops.get_table_profile(
-                self._client._client_options._use_profile, table_fqn
-            )
-            try:
-                table_sources_info = self._client._dataplex_ops.get_table_sources_info(
-                    self._client._client_options._use_lineage_tables, table_fqn
-                )
-            except Exception as e:
-                logger.error(f"Error getting table sources info for table {table_fqn}: {e}")
-                table_sources_info = None
-            try:
-                job_sources_info = self._client._dataplex_ops.get_job_sources(
-                    self._client._client_options._use_lineage_processes, table_fqn
-                )
-            except Exception as e:
-                logger.error(f"Error getting job sources info for table {table_fqn}: {e}")
-                job_sources_info = None
+            # Get additional information: quality, profile, source tables and jobs in one lookup
+            if table_metadata is None:
+                table_metadata = self._client._table_ops._get_table_metadata_bundle(table_fqn)
+            table_quality = table_metadata["quality"]
+            table_profile = table_metadata["profile"]
+            table_sources_info = table_metadata["table_sources"]
+            job_sources_info = table_metadata["job_sources"]
 
             if documentation_uri == "":
                 documentation_uri = None
@@ -192,6 +188,13 @@ class ColumnOperations:
             # descriptions and then swap it
             updated_schema = []
             updated_columns = []
+            # Draft descriptions are written together once all columns are generated
+            draft_descriptions = {}
+            # Regeneration flags of every column are read with a single entry lookup
+            if self._client._client_options._regenerate:
+                columns_to_regenerate = self._client._dataplex_ops.check_regeneration_flags(
+                    table_fqn, [column.name for column in table_schema]
+                )["columns"]
 
             # Iterate over the columns in the table schema
             for column in table_schema:
@@ -214,7 +217,7 @@ class ColumnOperations:
                     human_comments=human_comments
                 )
 
-                if self._client._client_options._regenerate == True and self._client._dataplex_ops.check_if_column_should_be_regenerated(table_fqn, column.name) or self._client._client_options._regenerate == False:
+                if self._client._client_options._regenerate == True and columns_to_regenerate[column.name] or self._client._client_options._regenerate == False:
                     column_description = self._client._utils.llm_inference(
                         column_description_prompt_expanded,
                         documentation_uri=documentation_uri,
@@ -226,24 +229,26 @@ class ColumnOperations:
                         self._get_updated_column(column, column_description)
                     )
                     if self._client._client_options._stage_for_review:
-                        self._client._dataplex_ops.update_column_draft_description(table_fqn, column.name, column_description)
+                        draft_descriptions[column.name] = column_description
                     updated_columns.append(column)
-                    logger.info(f"Generated column description: {column_description}.")
+                    logger.info("Generated column description: %s.", column_description)
                    # if self._client._client_options._regenerate:
                    #     self._client._dataplex_ops.mark_column_as_regenerated(table_fqn, column.name)
                    #     logger.info(f"Marked column {column.name} as regenerated in Dataplex catalog.")
                     
                 else:
                     updated_schema.append(column)
-                    logger.info(f"Column {column.name} will not be updated.")
+                    logger.info("Column %s will not be updated.", column.name)
 
-            if not self._client._client_options._stage_for_review:
+            if self._client._client_options._stage_for_review:
+                self._client._dataplex_ops.update_columns_draft_descriptions(table_fqn, draft_descriptions)
+            else:
                 self._client._bigquery_ops.update_table_schema(table_fqn, updated_schema)
             
             if self._client._client_options._regenerate:
                 for column in updated_columns:                    
                     self._client._dataplex_ops.mark_column_as_regenerated(table_fqn, column.name)
-                    logger.info(f"Marked table {table_fqn} column {column.name} as regenerated")
+                    logger.info("Marked table %s column %s as regenerated", table_fqn, column.name)
 
         except Exception as e:
             logger.error(f"Update of column description table {table_fqn} failed.")
@@ -284,7 +289,7 @@ class ColumnOperations:
         """
         try:
             if not profile or len(profile) == 0:
-                logger.info(f"No profile found for column {column_name}.")
+                logger.info("No profile found for column %s.", column_name)
                 return None
             
             fields = profile[0]['profile']['fields']
@@ -17,13 +17,20 @@ limitations under the License.
    2024 Google
 """
 # Standard library imports
+import asyncio
+import functools
 import logging
+import os
 import toml
 import pkgutil
 import datetime
 import uuid
-import json
+import orjson
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 
 # Cloud imports
@@ -39,143 +46,325 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Resolved once at import instead of on every call
+_DATAPLEX_CATALOG_CLIENT_KEY = constants["CLIENTS"]["DATAPLEX_CATALOG"]
+_PRODUCT_INITIAL_METADATA_SUFFIX = "product-initial-metadata"
+# Entries read back-to-back for the same table are served from memory for this long
+_ENTRY_CACHE_TTL_SECONDS = 10
+_ENTRY_CACHE_MAX_SIZE = 1024
+# Contracts change rarely, so downloaded contracts are kept longer
+_CONTRACT_CACHE_TTL_SECONDS = 300
+
+def _load_contract_json(path: str) -> dict:
+    """Loads a contract JSON file, reparsing it when the file changes.
+
+    The returned dict is shared and must not be mutated.
+    """
+    return _load_contract_json_version(path, os.stat(path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=32)
+def _load_contract_json_version(path: str, mtime_ns: int) -> dict:
+    """Parses one version of a contract file, keyed by its modification time."""
+    with open(path, "rb") as file:
+        return orjson.loads(file.read())
+
+
 class DataProductOperations:
     """Dataplex-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._entry_cache = {}
+        self._entry_cache_lock = threading.Lock()
+        self._storage_client = None
+        self._contract_cache = {}
+        self._contract_cache_lock = threading.Lock()
+        self._validate_prompt = constants["PROMPTS"]["ASPECT_VALIDATION"]
+        self._aspect_type_prefix = f"projects/{client._project_id}/locations/global/aspectTypes/"
+
+    def _get_storage_client(self) -> storage.Client:
+        """Returns the storage client, creating it on first use."""
+        if self._storage_client is None:
+            self._storage_client = storage.Client()
+        return self._storage_client
+
+    def _download_contract(self, contract_uri: str) -> dict:
+        """Downloads and parses a contract from GCS, reusing recent downloads.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        now = time.monotonic()
+        with self._contract_cache_lock:
+            cached = self._contract_cache.get(contract_uri)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # Get the bucket and blob names from the gs://bucket/path URI
+        bucket_name, _, blob_name = contract_uri.removeprefix("gs://").partition("/")
+
+        # bucket() only builds a reference; get_bucket() would fetch the bucket metadata first
+        blob = self._get_storage_client().bucket(bucket_name).blob(blob_name)
+
+        json_data = blob.download_as_bytes()
+        logger.info (f"json contract to be used. Location : {contract_uri}, data : {json_data}")
+        contract = orjson.loads(json_data)
+        with self._contract_cache_lock:
+            self._contract_cache[contract_uri] = (now + _CONTRACT_CACHE_TTL_SECONDS, contract)
+        return contract
+
+    def _build_entry_name(self, table_fqn: str) -> str:
+        """Returns the Dataplex entry name of a BigQuery table.
+
+        The name (which needs a dataset location lookup) is memoized per table
+        by the Dataplex operations.
+        """
+        return self._client._dataplex_ops._build_entry_name(table_fqn)
 
-    def create_product_description(self,table_fqn):
-        try:
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.ALL)
-            entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""product-initial-metadata"""):
-                    if  "external-documentation" in aspect.data:
-                        return self._client._table_ops.generate_table_description(table_fqn,aspect.data['external-documentation'])
-                    return self._client._table_ops.generate_table_description(table_fqn)
-                 
-        except Exception as e:
-            logger.error(f"Exception: {e}.")
-            raise e
-
-    def _get_valid_json_from_url(self,json_url):
-        with open(json_url, 'r') as file:
-                json_data = json.load(file)
-        return json_data
-
-    def get_product_status(self, table_fqn):
-        project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+    def _get_entry_cached(self, request: dataplex_v1.GetEntryRequest, refresh: bool = False) -> dataplex_v1.Entry:
+        """Returns the entry for a GetEntryRequest, reusing a recent response.
 
-        entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-        request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.ALL)
-        entry = client.get_entry(request=request)
+        Responses are cached for _ENTRY_CACHE_TTL_SECONDS, keyed by entry name,
+        view and aspect types. refresh forces a new read and stores its result.
+        """
+        key = (request.name, request.view, tuple(request.aspect_types))
+        now = time.monotonic()
+        if not refresh:
+            with self._entry_cache_lock:
+                cached = self._entry_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        entry = self._client._cloud_clients[_DATAPLEX_CATALOG_CLIENT_KEY].get_entry(request=request)
+        with self._entry_cache_lock:
+            if len(self._entry_cache) >= _ENTRY_CACHE_MAX_SIZE:
+                self._entry_cache = {k: v for k, v in self._entry_cache.items() if v[0] > now}
+            self._entry_cache[key] = (now + _ENTRY_CACHE_TTL_SECONDS, entry)
+        return entry
+
+    def _invalidate_entry_cache(self, entry_name: str) -> None:
+        """Drops every cached response for an entry, here and in the Dataplex operations."""
+        with self._entry_cache_lock:
+            for key in [k for k in self._entry_cache if k[0] == entry_name]:
+                del self._entry_cache[key]
+        self._client._dataplex_ops._invalidate_cached_entry(entry_name)
+
+    def _find_product_initial_metadata_aspect(self, entry: dataplex_v1.Entry) -> Tuple[Optional[str], Optional[dataplex_v1.Aspect]]:
+        """Returns the key and the product-initial-metadata aspect of an entry, or (None, None).
+
+        Looks up the expected aspect key directly and only scans the aspects
+        when the key uses another form (e.g. a project number).
+        """
+        aspect_key = f"{self._client._project_id}.global.{_PRODUCT_INITIAL_METADATA_SUFFIX}"
+        aspect = entry.aspects.get(aspect_key)
+        if aspect is not None:
+            return aspect_key, aspect
         for aspect_key, aspect in entry.aspects.items():
-            if aspect_key.endswith(f"""product-initial-metadata"""):
-                return aspect.data['status']
+            if aspect_key.endswith(_PRODUCT_INITIAL_METADATA_SUFFIX):
+                return aspect_key, aspect
+        return None, None
+
+    def _get_product_initial_metadata_aspect(self, entry: dataplex_v1.Entry) -> Optional[dataplex_v1.Aspect]:
+        """Returns the product-initial-metadata aspect of an entry, or None."""
+        return self._find_product_initial_metadata_aspect(entry)[1]
+
+    def _product_initial_metadata_entry_request(self, entry_name: str) -> dataplex_v1.GetEntryRequest:
+        """Builds a GetEntryRequest that only returns the product-initial-metadata aspect."""
+        return dataplex_v1.GetEntryRequest(
+            name=entry_name,
+            view=dataplex_v1.EntryView.CUSTOM,
+            aspect_types=[f"{self._aspect_type_prefix}{_PRODUCT_INITIAL_METADATA_SUFFIX}"]
+        )
 
-    def update_product_status(self,table_fqn,status):
-        
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+    def create_product_description(self, table_fqn: str) -> Optional[str]:
         project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-        aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/product-initial-metadata"""
+        return self.create_product_description_from_ids(project_id, dataset_id, table_id)
+
+    def create_product_description_from_ids(self, project_id: str, dataset_id: str, table_id: str) -> Optional[str]:
+        """Generates the description of a data product table from its ids.
 
+        Args:
+            project_id (str): The project of the table
+            dataset_id (str): The dataset of the table
+            table_id (str): The table name
+
+        Returns:
+            The generated table description, or None if the table is not a data product
+        """
+        table_fqn = f"{project_id}.{dataset_id}.{table_id}"
+        entry_name = self._build_entry_name(table_fqn)
+        request = self._product_initial_metadata_entry_request(entry_name)
+        entry = self._get_entry_cached(request)
+        aspect = self._get_product_initial_metadata_aspect(entry)
+        if aspect is not None:
+            if  "external-documentation" in aspect.data:
+                return self._client._table_ops.generate_table_description(table_fqn,aspect.data['external-documentation'])
+            return self._client._table_ops.generate_table_description(table_fqn)
+
+    async def acreate_product_description(self, table_fqn: str) -> Optional[str]:
+        """Async variant of create_product_description.
+
+        The entry is read with the async catalog client; the location lookup and
+        the description generation are blocking and run in a worker thread.
+        """
+        client = self._client._get_async_catalog_client()
+        entry_name = await asyncio.to_thread(self._build_entry_name, table_fqn)
+        request = self._product_initial_metadata_entry_request(entry_name)
+        entry = await client.get_entry(request=request)
+        aspect = self._get_product_initial_metadata_aspect(entry)
+        if aspect is not None:
+            if "external-documentation" in aspect.data:
+                return await asyncio.to_thread(self._client._table_ops.generate_table_description, table_fqn, aspect.data['external-documentation'])
+            return await asyncio.to_thread(self._client._table_ops.generate_table_description, table_fqn)
+
+    def _get_valid_json_from_url(self, json_url: str) -> dict:
+        return _load_contract_json(json_url)
+
+    def get_product_status(self, table_fqn: str) -> Optional[str]:
+        entry_name = self._build_entry_name(table_fqn)
+        request = self._product_initial_metadata_entry_request(entry_name)
+        entry = self._get_entry_cached(request)
+        aspect = self._get_product_initial_metadata_aspect(entry)
+        if aspect is not None:
+            return aspect.data['status']
+
+    def _product_status_update_request(self, table_fqn: str, entry: dataplex_v1.Entry, status: str) -> dataplex_v1.UpdateEntryRequest:
+        """Builds the UpdateEntryRequest that sets the status of a product aspect read from entry."""
+        aspect_type = f"{self._aspect_type_prefix}{_PRODUCT_INITIAL_METADATA_SUFFIX}"
+        aspect_name, aspect = self._find_product_initial_metadata_aspect(entry)
+        if aspect is None:
+            raise ValueError(f"Table {table_fqn} has no {_PRODUCT_INITIAL_METADATA_SUFFIX} aspect")
+
+        logger.info("Updating existing aspect %s", aspect.data)
         new_aspect = dataplex_v1.Aspect()
-        aspect_name = None
+        new_aspect.aspect_type = aspect_type
+        new_aspect.data = aspect.data
+        new_aspect.data.update({
+                "status":status,
+                               })
 
-        entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-        request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.ALL)
-        entry = client.get_entry(request=request)
-        for aspect_key, aspect in entry.aspects.items():
-            if aspect_key.endswith(f"""product-initial-metadata"""):
-                logger.info(f"Updating existing aspect {aspect.data}")
-                new_aspect.data = aspect.data
-                new_aspect.data.update({
-                        "status":status,
-                                       })
-                new_aspect.aspect_type = aspect_key
-                aspect_name = aspect_key
-                break
-             
         # Create new entry with updated aspect
-        
         new_entry = dataplex_v1.Entry()
-        new_entry.name = entry_name
-        new_entry.aspects[aspect_key] = new_aspect
-        # Update entry
-        request = dataplex_v1.UpdateEntryRequest(
+        new_entry.name = entry.name
+        new_entry.aspects[aspect_name] = new_aspect
+        return dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
                 update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
                 allow_missing=False,
                 aspect_keys=[aspect_name]
         )
 
+    def update_product_status(self, table_fqn: str, status: str) -> bool:
+        """Sets the status field of a table's product-initial-metadata aspect.
+
+        Dataplex replaces aspect data as a whole, so the other fields of the aspect
+        are sent back unchanged; aspect_keys restricts the write to this one aspect.
+        """
+        client = self._client._cloud_clients[_DATAPLEX_CATALOG_CLIENT_KEY]
+
+        entry_name = self._build_entry_name(table_fqn)
+        request = self._product_initial_metadata_entry_request(entry_name)
+        # Always read fresh data before writing it back
+        entry = self._get_entry_cached(request, refresh=True)
+
         # Make the request
-        response = client.update_entry(request=request)
+        response = client.update_entry(request=self._product_status_update_request(table_fqn, entry, status))
+        self._invalidate_entry_cache(entry_name)
         logger.info(f"Successfully updated status {status} in table {table_fqn} ")
         return True
 
+    async def aupdate_product_status(self, table_fqn: str, status: str) -> bool:
+        """Async variant of update_product_status using the async catalog client."""
+        client = self._client._get_async_catalog_client()
+
+        entry_name = await asyncio.to_thread(self._build_entry_name, table_fqn)
+        entry = await client.get_entry(request=self._product_initial_metadata_entry_request(entry_name))
+
+        response = await client.update_entry(request=self._product_status_update_request(table_fqn, entry, status))
+        self._invalidate_entry_cache(entry_name)
+        logger.info(f"Successfully updated status {status} in table {table_fqn} ")
+        return True
 
-    def initialize_contract_aspect(self,json_url,table_fqn):
+    def bulk_update_product_status(self, updates: List[Tuple[str, str]], max_workers: int = 16) -> List[dict]:
+        """Updates the product status of several tables concurrently.
+
+        Args:
+            updates: Tuples of (table_fqn, status).
+            max_workers: Maximum number of tables updated at once.
+
+        Returns:
+            list: One dict per update with keys 'table_fqn', 'status', 'success' and 'error'.
+        """
+        def update_one(update):
+            table_fqn, status = update
+            try:
+                self.update_product_status(table_fqn, status)
+                return {"table_fqn": table_fqn, "status": status, "success": True, "error": None}
+            except Exception as e:
+                logger.error(f"Failed to update status {status} in table {table_fqn}: {e}")
+                return {"table_fqn": table_fqn, "status": status, "success": False, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(update_one, updates))
+
+    def initialize_contract_aspect(self, json_url: str, table_fqn: str) -> None:
         try:
             json_file = self._get_valid_json_from_url(json_url)          
             self._client._dataplex_ops._attach_aspect_from_json(json_file,table_fqn)
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+        except Exception:
+            logger.exception("Failed to initialize the contract aspect of table %s", table_fqn)
 
-    def get_contract(self, table_fqn):
+    def get_contract(self, table_fqn: str) -> Optional[dict]:
         try:
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.ALL)
-            entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""product-initial-metadata"""):
-                    if  "external-contract" in aspect.data:
-                                # Create a client to interact with Google Cloud Storage
-                        storage_client = storage.Client()
-                        # Get the bucket and blob names from the URI
-                        contract_uri =aspect.data['external-contract']
-                        logger.info(f"Contract used  {contract_uri}")
-
-                        bucket_name, blob_name =  contract_uri.split("/", 3)[2:]
-
-                        # Get the bucket and blob objects
-                        bucket = storage_client.get_bucket(bucket_name)
-                        blob = bucket.blob(blob_name)
-
-                        # Download the json file as a string
-                        json_data = blob.download_as_text()
-                        logger.info (f"json contract to be used. Location : {contract_uri}, data : {json_data}")
-                        json_file = json.loads(json_data)
-                        return json_file
+            entry_name = self._build_entry_name(table_fqn)
+            request = self._product_initial_metadata_entry_request(entry_name)
+            entry = self._get_entry_cached(request)
+            aspect = self._get_product_initial_metadata_aspect(entry)
+            if aspect is not None and "external-contract" in aspect.data:
+                contract_uri =aspect.data['external-contract']
+                logger.info(f"Contract used  {contract_uri}")
+                return self._download_contract(contract_uri)
                         
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+        except Exception:
+            logger.exception("Failed to get the contract of table %s", table_fqn)
             return None
       
     
-    def initialize_contract_aspect_product(self,json_data,table_fqn):
+    async def aget_contract(self, table_fqn: str) -> Optional[dict]:
+        """Async variant of get_contract.
+
+        The entry is read with the async catalog client; the GCS download runs
+        in a worker thread.
+        """
+        try:
+            entry_name = await asyncio.to_thread(self._build_entry_name, table_fqn)
+            client = self._client._get_async_catalog_client()
+            entry = await client.get_entry(request=self._product_initial_metadata_entry_request(entry_name))
+            aspect = self._get_product_initial_metadata_aspect(entry)
+            if aspect is not None and "external-contract" in aspect.data:
+                contract_uri =aspect.data['external-contract']
+                logger.info(f"Contract used  {contract_uri}")
+                return await asyncio.to_thread(self._download_contract, contract_uri)
+
+        except Exception:
+            logger.exception("Failed to get the contract of table %s", table_fqn)
+            return None
+
+    def initialize_contract_aspect_product(self, json_data: dict, table_fqn: str, max_workers: int = 8) -> None:
         try:
             contract_items = json_data["contract_terms"]
 
-            for item in contract_items:
-                aspect_name = item["aspect_name"]
-                #existing_aspect_type = self._client._dataplex_ops._check_if_exists_aspect_type(aspect_name)
-                self._client._dataplex_ops._attach_aspect_from_json(item,table_fqn)
+            # Each term is written under its own aspect key, so the updates are independent
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(
+                    lambda item: self._client._dataplex_ops._attach_aspect_from_json(item, table_fqn),
+                    contract_items
+                ))
 
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+        except Exception:
+            logger.exception("Failed to initialize the contract aspects of table %s", table_fqn)
 
-    def create_contract_aspects_types(self,json_data, table_fqn):
+    def create_contract_aspects_types(self, json_data: dict, table_fqn: str, max_workers: int = 8) -> None:
         """
         Processes the 'contract_tems' array from a JSON URL.
 
@@ -185,58 +374,112 @@ class DataProductOperations:
 
         Args:
             json data: Json object.
+            max_workers: Maximum number of aspect types checked or created at once.
         """
         #try:
 
         contract_items = json_data["contract_terms"]
 
+        # Aspect types are independent, so they are checked and created concurrently.
+        # Only the first term per aspect name is used, as a later one would find it existing.
+        items_by_name = {}
         for item in contract_items:
-                aspect_name = item["aspect_name"]
-                existing_aspect_type = self._client._dataplex_ops._check_if_exists_aspect_type(aspect_name)
-                print(existing_aspect_type)
-                if not existing_aspect_type:
-                    self._client._dataplex_ops._create_aspect_type_from_json(item)
+            items_by_name.setdefault(item["aspect_name"], item)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self._create_contract_aspect_type_if_missing, items_by_name.values()))
 
         #except Exception as e:
         #    print(f"An unexpected error occurred: {e}")
 
-    def validate_contract(self,json_contract, table_fqn):
-        #TODO retreive all the aspect and for each of them validate agains the initial contract 
-        contract_items = json_contract["contract_terms"]
-
-        # Create a client
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-
-        #aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
-        project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-
-        entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-
-        request = dataplex_v1.GetEntryRequest(
+    def _create_contract_aspect_type_if_missing(self, item: dict) -> None:
+        """Creates the aspect type described by a contract term unless it already exists."""
+        aspect_name = item["aspect_name"]
+        existing_aspect_type = self._client._dataplex_ops._check_if_exists_aspect_type(aspect_name)
+        logger.debug("Aspect type %s exists: %s", aspect_name, existing_aspect_type)
+        if not existing_aspect_type:
+            self._client._dataplex_ops._create_aspect_type_from_json(item)
+
+    def _validate_contract_aspect(self, aspect_json: dict, aspect: dataplex_v1.Aspect) -> dict:
+        """Asks the LLM to validate one aspect against its contract term."""
+        aspect_prompt = f"{self._validate_prompt} contract json : {aspect_json} contract value : {aspect} "
+        return self._client._utils.llm_inference_validate_field(aspect_prompt)
+
+    def _contract_entry_request(self, entry_name: str, contract_items: List[dict]) -> dataplex_v1.GetEntryRequest:
+        """Builds a GetEntryRequest for the aspects named by a contract."""
+        return dataplex_v1.GetEntryRequest(
                 name=entry_name,
-                view=dataplex_v1.EntryView.ALL
+                view=dataplex_v1.EntryView.CUSTOM,
+                aspect_types=[
+                    f"{self._aspect_type_prefix}{aspect_name}"
+                    for aspect_name in dict.fromkeys(item.get("aspect_name") for item in contract_items)
+                ]
             )
-        overview = None
-            
-        entry = client.get_entry(request=request)
-        report = "{["
-        validate_prompt = constants["PROMPTS"]["ASPECT_VALIDATION"]
+
+    def _match_contract_aspects(self, entry: dataplex_v1.Entry, contract_items: List[dict]) -> List[Tuple[dict, dataplex_v1.Aspect]]:
+        """Returns the (contract term, aspect) pairs to validate for an entry."""
+        contract_items_by_name = {}
+        for aspect_json in contract_items:
+            contract_items_by_name.setdefault(aspect_json.get("aspect_name"), []).append(aspect_json)
+
+        validations = []
         for aspect_key, aspect in entry.aspects.items():
             logger.info(f"Processing aspect: {aspect_key}")
             logger.info(f"Aspect path: {aspect.path}")
-            for aspect_json in contract_items:
-
-                if aspect_key.endswith(aspect_json.get("aspect_name")):
-                    print(aspect_json.get("aspect_name"))
-                    #print (aspect_json)
-                    #print(aspect)
-                    aspect_prompt = f"{validate_prompt} contract json : {aspect_json} contract value : {aspect} "
-                    status = self._client._utils.llm_inference_validate_field(aspect_prompt)
-                    status = status.replace("```json","").replace("```","")
+            # Contracts describe table-level aspects; column aspects ("...@Schema.<column>") are skipped
+            if aspect.path != "":
+                continue
+            # Aspect keys are "<project>.<location>.<aspect type id>"
+            aspect_type_id = aspect_key.rsplit(".", 1)[-1]
+            for aspect_json in contract_items_by_name.get(aspect_type_id, ()):
+                logger.debug("Validating contract term %s", aspect_json.get("aspect_name"))
+                validations.append((aspect_json, aspect))
+        return validations
+
+    def _build_validation_report(self, statuses: List[dict]) -> str:
+        """Joins the parsed LLM validation results into a JSON array."""
+        return orjson.dumps(list(statuses)).decode()
+
+    def validate_contract(self, json_contract: dict, table_fqn: str, max_workers: int = 16) -> str:
+        """Validates the aspects of a table against its data contract.
+
+        Returns:
+            str: JSON array with one LLM validation result per matched aspect
+        """
+        #TODO retreive all the aspect and for each of them validate agains the initial contract 
+        contract_items = json_contract["contract_terms"]
 
-                    report += status + ","
-        report += "]}"
-        report = report.replace(",]}","]}")
+        entry_name = self._build_entry_name(table_fqn)
+        # Only the aspects named by the contract are needed. They are always read
+        # fresh, as the aspects may just have been attached by another Client
+        entry = self._get_entry_cached(self._contract_entry_request(entry_name, contract_items), refresh=True)
+        validations = self._match_contract_aspects(entry, contract_items)
+
+        # Each validation is an independent LLM call; map keeps the report order stable
+        statuses = []
+        if validations:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(validations))) as executor:
+                statuses = list(executor.map(
+                    lambda validation: self._validate_contract_aspect(*validation),
+                    validations
+                ))
+        return self._build_validation_report(statuses)
+
+    async def avalidate_contract(self, json_contract: dict, table_fqn: str) -> str:
+        """Async variant of validate_contract.
+
+        The entry is read with the async catalog client and the LLM validations
+        run concurrently in worker threads.
+        """
+        contract_items = json_contract["contract_terms"]
 
+        entry_name = await asyncio.to_thread(self._build_entry_name, table_fqn)
+        client = self._client._get_async_catalog_client()
+        entry = await client.get_entry(request=self._contract_entry_request(entry_name, contract_items))
+        validations = self._match_contract_aspects(entry, contract_items)
 
-        return report
\ No newline at end of file
+        statuses = await asyncio.gather(*[
+            asyncio.to_thread(self._validate_contract_aspect, aspect_json, aspect)
+            for aspect_json, aspect in validations
+        ])
+        return self._build_validation_report(statuses)
\ No newline at end of file
@@ -17,11 +17,14 @@ limitations under the License.
    2024 Google
 """
 # Standard library imports
+import functools
 import logging
 import toml
 import pkgutil
-import datetime
 import uuid
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Cloud imports
 from google.cloud import dataplex_v1
@@ -34,16 +37,101 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Dataplex entry of a BigQuery table
+_ENTRY_NAME_TEMPLATE = "projects/{project_id}/locations/{location}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+# Fields of a newly created metadata aspect. Only contents, generation-date and
+# to-be-regenerated vary between writers.
+_DRAFT_ASPECT_TEMPLATE = {
+    "certified": False,
+    "user-who-certified": "",
+    "contents": "",
+    "generation-date": "",
+    "to-be-regenerated": False,
+    "human-comments": [],
+    "negative-examples": [],
+    "external-document-uri": "",
+    "is-accepted": False
+}
+
+# System aspects read for prompts, by the key get_table_metadata_bundle returns them under
+_SYSTEM_ASPECT_TYPES = {
+    "quality": "projects/dataplex-types/locations/global/aspectTypes/data_quality",
+    "profile": "projects/dataplex-types/locations/global/aspectTypes/data_profile",
+    "table_sources": "projects/dataplex-types/locations/global/aspectTypes/lineage",
+    "job_sources": "projects/dataplex-types/locations/global/aspectTypes/process_lineage",
+}
+# Aspect type "projects/dataplex-types/locations/global/aspectTypes/<id>" is keyed "dataplex-types.global.<id>"
+_SYSTEM_ASPECT_KEYS = {
+    name: "dataplex-types.global." + aspect_type.rsplit("/", 1)[-1]
+    for name, aspect_type in _SYSTEM_ASPECT_TYPES.items()
+}
+
+def _flag_is_set(value):
+    """Reads a bool aspect field, which older versions stored as the string "true"/"false"."""
+    return value is True or (isinstance(value, str) and value.lower() == "true")
+
+def _utc_now_iso():
+    """Returns the current UTC time as an ISO 8601 string, e.g. 2024-01-31T12:00:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+# Bulk updates submit at most this many calls to the thread pool at a time
+_WORKERS_BATCH_SIZE = 200
+# Entries written through _read_modify_write_aspect are reused for this long.
+# The cache and the write locks are module level, so they are shared by every
+# Client of the process and every writer here invalidates them. A write made by
+# another process within the TTL can still be overwritten by a local update.
+_ENTRY_CACHE_TTL_SECONDS = 10
+_ENTRY_CACHE_MAX_SIZE = 1024
+# (entry name, aspect type) -> (expiry, entry) of the last write
+_entry_cache = {}
+_entry_cache_lock = threading.Lock()
+# Read-modify-write updates of an entry are serialized by one of a fixed set of
+# locks, picked by entry name, so the number of locks does not grow with the tables
+_ASPECT_WRITE_LOCKS_COUNT = 64
+_aspect_write_locks = tuple(threading.Lock() for _ in range(_ASPECT_WRITE_LOCKS_COUNT))
+
+def _aspect_write_lock(entry_name):
+    """Returns the lock serializing read-modify-write updates of an entry."""
+    return _aspect_write_locks[hash(entry_name) % _ASPECT_WRITE_LOCKS_COUNT]
+# Quality, profile and lineage aspects change with scans and jobs, not per call
+_SYSTEM_ASPECTS_CACHE_TTL_SECONDS = 600
+# Aspect types can be created or deleted by other processes, so the listing is refreshed after this long
+_KNOWN_ASPECT_TYPES_TTL_SECONDS = 60
+
 class DataplexOperations:
     """Dataplex-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        # Aspect names built once instead of on every call
+        self._aspect_template_name = constants["ASPECT_TEMPLATE"]["name"]
+        self._aspect_type_fqn = f"projects/{client._project_id}/locations/global/aspectTypes/{self._aspect_template_name}"
+        self._aspect_key_suffix = f"global.{self._aspect_template_name}"
+        self._aspect_key = f"{client._project_id}.{self._aspect_key_suffix}"
+        self._overview_aspect_type = "projects/dataplex-types/locations/global/aspectTypes/overview"
+        self._draft_aspect_template_struct = json_format.ParseDict(_DRAFT_ASPECT_TEMPLATE, struct_pb2.Struct())
+        # (table_fqn, _SYSTEM_ASPECT_TYPES key) -> (expiry, aspect data)
+        self._system_aspects_cache = {}
+        self._system_aspects_cache_lock = threading.Lock()
+        # (expiry, ids of the project's global aspect types), listed on first use
+        self._known_aspect_types = None
+        # Serializes listing the aspect types, so concurrent checks share one ListAspectTypes
+        self._known_aspect_types_lock = threading.Lock()
+        # Serializes aspect type check-and-create between generation workers
+        self._aspect_types_lock = threading.Lock()
+        # Dataset locations do not change, so each dataset is looked up once per client
+        self._get_dataset_location_cached = functools.lru_cache(maxsize=4096)(self._fetch_dataset_location)
+        # Entry names depend only on the table, so each one is built once per client
+        self._build_entry_name = functools.lru_cache(maxsize=4096)(self._format_entry_name)
 
     def _check_if_exists_aspect_type(self, aspect_type_id: str):
         """Checks if a specified aspect type exists in Dataplex catalog.
 
+        The project's aspect types are listed and kept in a set for
+        _KNOWN_ASPECT_TYPES_TTL_SECONDS. Only one thread lists them when the set is
+        missing or expired, and aspect types this client creates are added to it.
+
         Args:
             aspect_type_id (str): The ID of the aspect type to check
 
@@ -51,23 +139,64 @@ class DataplexOperations:
             bool: True if the aspect type exists, False otherwise
 
         Raises:
-            Exception: If there is an error checking the aspect type existence
-                beyond a NotFound error
+            Exception: If there is an error listing the aspect types
         """
-        # Create a client
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+        cached = self._known_aspect_types
+        if cached is None or cached[0] <= time.monotonic():
+            with self._known_aspect_types_lock:
+                # Another thread may have listed them while this one waited
+                cached = self._known_aspect_types
+                now = time.monotonic()
+                if cached is None or cached[0] <= now:
+                    # Create a client
+                    client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+
+                    # Initialize request argument(s)
+                    request = dataplex_v1.ListAspectTypesRequest(
+                        parent=f"projects/{self._client._project_id}/locations/global"
+                    )
+
+                    # Make the request
+                    try:
+                        known_aspect_types = {aspect_type.name.rsplit("/", 1)[-1] for aspect_type in client.list_aspect_types(request=request)}
+                    except Exception as e:
+                        logger.error(f"Failed to list aspect types: {e}")
+                        raise e
+                    cached = (now + _KNOWN_ASPECT_TYPES_TTL_SECONDS, known_aspect_types)
+                    self._known_aspect_types = cached
+
+        return aspect_type_id in cached[1]
+
+    def _remember_aspect_type(self, aspect_type_id: str):
+        """Adds an aspect type known to exist to the listed ones, if they are listed."""
+        with self._known_aspect_types_lock:
+            if self._known_aspect_types is not None:
+                self._known_aspect_types[1].add(aspect_type_id)
+
+    def _ensure_aspect_type(self, aspect_type_id: str):
+        """Creates the wizard aspect type unless it already exists.
+
+        Safe to call from several generation workers at once: the check and the
+        creation run under a lock, and an aspect type created concurrently by
+        another process counts as success.
 
-        # Initialize request argument(s)
-        request = dataplex_v1.GetAspectTypeRequest(
-            name=f"projects/{self._client._project_id}/locations/global/aspectTypes/{aspect_type_id}"
-        )
-        
-        # Make the request
-        try:
-            client.get_aspect_type(request=request)
-            return True
-        except google.api_core.exceptions.NotFound:
-            return False
+        Args:
+            aspect_type_id (str): The ID of the aspect type
+
+        Raises:
+            Exception: If there is an error listing or creating the aspect type
+        """
+        with self._aspect_types_lock:
+            if self._check_if_exists_aspect_type(aspect_type_id):
+                return
+            logger.info("Aspect type %s not exists. Attempting to create it", aspect_type_id)
+            try:
+                self._create_aspect_type(aspect_type_id)
+            except google.api_core.exceptions.AlreadyExists:
+                logger.info("Aspect type %s was created concurrently", aspect_type_id)
+                self._remember_aspect_type(aspect_type_id)
+            else:
+                logger.info("Aspect type %s created", aspect_type_id)
 
     def _create_aspect_type(self, aspect_type_id: str):
         """Creates a new aspect type in Dataplex catalog.
@@ -90,7 +219,7 @@ class DataplexOperations:
         }
         metadata_template = dataplex_v1.AspectType.MetadataTemplate(full_metadata_template)
 
-        logger.info("Will deploy following template:" + str(metadata_template))
+        logger.info("Will deploy following template: %s", metadata_template)
         
         aspect_type.metadata_template = metadata_template
         aspect_type.display_name = constants["ASPECT_TEMPLATE"]["display_name"]
@@ -107,14 +236,14 @@ class DataplexOperations:
         except Exception as e:
             logger.error(f"Failed to create aspect type: {e}")
             raise e
+        self._remember_aspect_type(aspect_type_id)
 
     def _attach_aspect_from_json(self,aspect_contract,table_fqn):
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
             #for aspect_contract in json_fiels['contract_terms']:
                  # Create entry name
             new_aspect_content = {}
@@ -127,8 +256,7 @@ class DataplexOperations:
             new_aspect = dataplex_v1.Aspect()
             new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{aspect_contract["aspect_name"]}"""
                 #initalise the aspect values            
-            data_struct = struct_pb2.Struct()
-            data_struct.update(new_aspect_content)
+            data_struct = json_format.ParseDict(new_aspect_content, struct_pb2.Struct())
             new_aspect.data = data_struct
             new_entry = dataplex_v1.Entry()
             new_entry.name = entry_name 
@@ -145,6 +273,8 @@ class DataplexOperations:
                 # Make the request
             try:
                     response = client.update_entry(request=request)
+                    # Contract aspects are read back through the data product cache too
+                    self._client._data_product_ops._invalidate_entry_cache(entry_name)
                     logger.info(f"Aspect created: {response.name}")
                     return True
             except Exception as e:
@@ -171,7 +301,7 @@ class DataplexOperations:
         # Initialize request argument(s)
         i=1
         for field in json_fiels['fields']:
-            print(field)
+            logger.debug("Aspect type field: %s", field)
             aspect_fields.append(
                             dataplex_v1.AspectType.MetadataTemplate
                             (
@@ -196,18 +326,18 @@ class DataplexOperations:
                 # Aspect Type fields, that themselves are Metadata Templates.
             record_fields=aspect_fields),
         )
-        parent=f"projects/{self._client._project_id}/locations/global",
-        print(parent)
-        print(template_name)
+        parent=f"projects/{self._client._project_id}/locations/global"
+        logger.debug("Creating aspect type %s in %s", template_name, parent)
         try:
             create_operation = client.create_aspect_type(
-                    parent=f"projects/{self._client._project_id}/locations/global",
+                    parent=parent,
                     aspect_type=aspect_type, 
                 aspect_type_id=template_name
             )
         except Exception as e:
             logger.error(f"Failed to create aspect type: {e}")
             raise e
+        self._remember_aspect_type(template_name)
 
     def update_table_dataplex_description(self, table_fqn, description):
         """Updates the table description in Dataplex.
@@ -223,74 +353,29 @@ class DataplexOperations:
             Exception: If there is an error updating the description
         """
         try:
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/dataplex-types/locations/global/aspectTypes/overview"""
-            aspect_types = [aspect_type]
-            old_overview = None
-            aspect_content = None
-
-            try:
-                request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
-                current_entry = client.get_entry(request=request)
-                for i in current_entry.aspects:
-                    if i.endswith(f"""global.overview""") and current_entry.aspects[i].path == "":
-                        logger.info(f"Reading existing aspect {i} of table {table_fqn}")
-                        old_overview = dict(current_entry.aspects[i].data)
-                        logger.info(f"""old_overview: {old_overview["content"][1:50]}...""")
-            except Exception as e:
-                logger.error(f"Exception: {e}.")
-                raise e
-
-            # Create the aspect
-            aspect = dataplex_v1.Aspect()
-            aspect.aspect_type = aspect_type
-            aspect_content = {}
-
-            if old_overview is not None:
-                old_description = old_overview["content"]
-                logger.debug(f"""old_description: {old_description[0:50]}...""")
-                logger.debug(f"""new description: {description[0:50]}...""")
-                logger.debug(f"""description_handling: {self._client._client_options._description_handling}""")
-                combined_description = self._client._utils.combine_description(
-                    old_description, 
-                    description, 
-                    self._client._client_options._description_handling
-                )
-                logger.debug(f"""FINAL combined_description: {combined_description}""")
-                aspect_content["content"] = combined_description
-            else:
-                aspect_content = {"content": description}
-
-            logger.info(f"""aspect_content: {aspect_content}...""")
-            # Convert aspect_content to a Struct
-            data_struct = struct_pb2.Struct()
-            data_struct.update(aspect_content)
-            aspect.data = data_struct
-
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._overview_aspect_type
             overview_path = f"dataplex-types.global.overview"
 
-            logger.info(f"project_id: {project_id}, dataset_id: {dataset_id}, table_id: {table_id}")
-            entry = dataplex_v1.Entry()
-            entry.name = entry_name
-            entry.aspects[overview_path] = aspect
+            def set_overview(aspect_data):
+                # Only the content field is read; the rest of the Struct is left untouched
+                old_description = aspect_data.get("content")
+                if old_description is not None:
+                    logger.debug(f"""old_description: {old_description[0:50]}...""")
+                    logger.debug(f"""new description: {description[0:50]}...""")
+                    logger.debug(f"""description_handling: {self._client._client_options._description_handling}""")
+                    combined_description = self._client._utils.combine_description(
+                        old_description, 
+                        description, 
+                        self._client._client_options._description_handling
+                    )
+                    logger.debug("FINAL combined_description: %s", combined_description)
+                    aspect_data["content"] = combined_description
+                else:
+                    aspect_data["content"] = description
 
-            # Initialize request argument(s)
-            request = dataplex_v1.UpdateEntryRequest(
-                entry=entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
-            )
-
-            # Make the request
-            try:
-                response = client.update_entry(request=request)
-                logger.info(f"Aspect created: {response.name}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to create aspect: {e}")
-                return False
+            logger.info(f"Updating Dataplex overview of {entry_name}")
+            return self._read_modify_write_aspect(entry_name, aspect_type, overview_path, "", set_overview)
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
@@ -311,87 +396,251 @@ class DataplexOperations:
             Exception: If there is an error updating the draft description
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
             # Create new aspect content
             new_aspect_content = {
-                #"certified": "false",
-                #"user-who-certified": "",
                 "contents": description,
-                "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "to-be-regenerated": "false",
-                #"human-comments": [],
-                #"negative-examples": []
-                "is-accepted": "false"
+                "generation-date": _utc_now_iso(),
+                "to-be-regenerated": False,
+                "is-accepted": False
             }
 
             # If additional metadata was provided, update the aspect content
             if metadata:
                 new_aspect_content.update(metadata)
 
-            logger.info(f"aspect_content: {new_aspect_content}")
-            
-            # Create the aspect
-            new_aspect = dataplex_v1.Aspect()
-            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [new_aspect.aspect_type]
+            logger.info("aspect_content: %s", new_aspect_content)
 
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
 
-            entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
 
-            # Check if the aspect already exists
-            try:
-                get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
-                entry = client.get_entry(request=get_request)
-            except Exception as e:
-                logger.error(f"Exception: {e}.")
-                raise e
+            return self._read_modify_write_aspect(
+                entry_name, aspect_type, aspect_name, "",
+                lambda aspect_data: aspect_data.update(new_aspect_content),
+                initial_data=self._draft_aspect_template_struct
+            )
 
-            data_struct = struct_pb2.Struct()
-            data_struct.update(new_aspect_content)
-            new_aspect.data = data_struct
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
-                    logger.info(f"Updating aspect {i} with old_values")
-                    new_aspect.data = entry.aspects[i].data
-                    update_data = {
-                        "contents": description,
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": "false",
-                        "is-accepted": "false"
-                    }
-                    if metadata:
-                        update_data.update(metadata)
-                    new_aspect.data.update(update_data)
-                    logger.info(f"entry.aspects[aspect_name].data: {entry.aspects[i].data}")
-                    logger.info(f"new_aspect.data: {new_aspect.data}")
+        except Exception as e:
+            logger.error(f"Exception: {e}.")
+            raise e
 
-            new_entry = dataplex_v1.Entry()
-            new_entry.name = entry.name
-            new_entry.aspects[aspect_name] = new_aspect
+    def bulk_update_table_draft_descriptions(self, items, max_workers=10):
+        """Updates the draft descriptions of several tables concurrently.
+
+        Each table is written with update_table_draft_description. Calls are
+        submitted in batches of _WORKERS_BATCH_SIZE so a large bulk sync does not
+        queue every request up front.
+
+        Args:
+            items (list): Tuples of (table_fqn, description).
+            max_workers (int): Maximum number of tables updated at once.
+
+        Returns:
+            list: One dict per item with keys 'table_fqn', 'success' and 'error',
+                in the order of items.
+        """
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_start in range(0, len(items), _WORKERS_BATCH_SIZE):
+                # All drafts of a batch share one generation date
+                metadata = {"generation-date": _utc_now_iso()}
+                futures = {
+                    executor.submit(self.update_table_draft_description, table_fqn, description, metadata): index
+                    for index, (table_fqn, description) in enumerate(
+                        items[batch_start:batch_start + _WORKERS_BATCH_SIZE], start=batch_start
+                    )
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    table_fqn = items[index][0]
+                    try:
+                        success = future.result()
+                        results[index] = {"table_fqn": table_fqn, "success": success, "error": None}
+                    except Exception as e:
+                        logger.error(f"Failed to update draft description of table {table_fqn}: {e}")
+                        results[index] = {"table_fqn": table_fqn, "success": False, "error": str(e)}
+        return results
+
+    def _get_cached_entry(self, entry_name, aspect_type):
+        """Returns the entry last written for an aspect type if it is still fresh, else None."""
+        with _entry_cache_lock:
+            cached = _entry_cache.get((entry_name, aspect_type))
+            if cached is None:
+                return None
+            expires_at, entry = cached
+            if expires_at < time.monotonic():
+                del _entry_cache[(entry_name, aspect_type)]
+                return None
+            return entry
+
+    def _cache_entry(self, entry_name, aspect_type, entry):
+        """Keeps an entry returned by UpdateEntry for _ENTRY_CACHE_TTL_SECONDS."""
+        with _entry_cache_lock:
+            if len(_entry_cache) >= _ENTRY_CACHE_MAX_SIZE:
+                _entry_cache.clear()
+            _entry_cache[(entry_name, aspect_type)] = (time.monotonic() + _ENTRY_CACHE_TTL_SECONDS, entry)
+
+    def _invalidate_cached_entry(self, entry_name):
+        """Drops every cached copy of an entry.
+
+        Must be called after every UpdateEntry on a table entry that bypasses
+        _read_modify_write_aspect, or the next update starts from the stale copy
+        and undoes the write.
+        """
+        with _entry_cache_lock:
+            for key in [key for key in _entry_cache if key[0] == entry_name]:
+                del _entry_cache[key]
+
+    def _find_aspect(self, entry, aspect_key, path=""):
+        """Finds an aspect of an entry by its key.
+
+        The key is looked up directly in the aspects map. Aspect keys may carry the
+        project number instead of the project id, so if the direct lookup misses,
+        the keys are scanned for the same "<location>.<aspect type>[@<path>]" suffix.
+
+        Args:
+            entry (dataplex_v1.Entry): The entry to search
+            aspect_key (str): The expected key, e.g. "<project>.global.<aspect type>@Schema.<column>"
+            path (str): The aspect path, "" for the table or "Schema.<column>"
+
+        Returns:
+            tuple: (key, aspect), or (None, None) if the entry has no such aspect
+        """
+        aspect = entry.aspects.get(aspect_key)
+        if aspect is not None and aspect.path == path:
+            return aspect_key, aspect
+        aspect_suffix = aspect_key.split(".", 1)[1]
+        for key, aspect in entry.aspects.items():
+            if key.endswith(aspect_suffix) and aspect.path == path:
+                return key, aspect
+        return None, None
+
+    def _find_draft_aspect(self, entry, column_name=None):
+        """Finds the metadata-wizard aspect of a table, or of one of its columns.
+
+        Args:
+            entry (dataplex_v1.Entry): The table entry
+            column_name (str, optional): The column, or None for the table aspect
+
+        Returns:
+            tuple: (key, aspect), or (None, None) if the entry has no such aspect
+        """
+        aspect_key = self._aspect_key
+        if column_name is None:
+            return self._find_aspect(entry, aspect_key)
+        return self._find_aspect(entry, f"{aspect_key}@Schema.{column_name}", f"Schema.{column_name}")
+
+    def _new_draft_aspect_struct(self, generation_date, to_be_regenerated, contents=""):
+        """Returns the data of a new metadata aspect, copied from the prebuilt template.
+
+        Args:
+            generation_date (str): The generation date to set
+            to_be_regenerated (bool): The to-be-regenerated flag to set
+            contents (str): The description to set
+
+        Returns:
+            struct_pb2.Struct: The aspect data
+        """
+        data_struct = struct_pb2.Struct()
+        data_struct.CopyFrom(self._draft_aspect_template_struct)
+        data_struct.fields["contents"].string_value = contents
+        data_struct.fields["generation-date"].string_value = generation_date
+        data_struct["to-be-regenerated"] = to_be_regenerated
+        return data_struct
+
+    def _read_modify_write_aspect(self, entry_name, aspect_type, aspect_key, path, mutate, initial_data=None):
+        """Applies an in-place change to one aspect of an entry.
+
+        The entry written by the previous call for the same entry and aspect type is
+        reused for up to _ENTRY_CACHE_TTL_SECONDS, so back-to-back writes skip the
+        GetEntry. Otherwise the entry is read with only the given aspect type. The
+        aspect data is passed to mutate and written back with a single UpdateEntry
+        restricted to aspect_key. Dataplex entries carry no etag, so concurrent
+        writers cannot be detected server-side; updates made through this client
+        are serialized per entry instead.
+
+        Args:
+            entry_name (str): The Dataplex entry name
+            aspect_type (str): The full resource name of the aspect type
+            aspect_key (str): The key of the aspect in the entry's aspects map
+            path (str): The aspect path, "" for the table or "Schema.<column>"
+            mutate (callable): Called with the aspect data (dict-like) to modify in place.
+                If the aspect does not exist yet it receives a copy of initial_data.
+            initial_data (struct_pb2.Struct, optional): Data a missing aspect starts
+                from. Defaults to an empty Struct.
+
+        Returns:
+            bool: True if successful, False if the update failed
+
+        Raises:
+            Exception: If there is an error reading the entry
+        """
+        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+
+        with _aspect_write_lock(entry_name):
+            entry = self._get_cached_entry(entry_name, aspect_type)
+            if entry is None or aspect_key not in entry.aspects:
+                request = dataplex_v1.GetEntryRequest(
+                    name=entry_name,
+                    view=dataplex_v1.EntryView.CUSTOM,
+                    aspect_types=[aspect_type]
+                )
+                entry = client.get_entry(request=request)
+
+            # The fetched entry is sent back as is: the update mask and aspect_keys
+            # make Dataplex ignore everything but aspect_key
+            existing_key, existing_aspect = self._find_aspect(entry, aspect_key, path)
+            if existing_aspect is not None:
+                logger.info(f"Updating aspect {existing_key} with old_values")
+                mutate(existing_aspect.data)
+                if existing_key != aspect_key:
+                    entry.aspects[aspect_key] = existing_aspect
+            else:
+                new_aspect = dataplex_v1.Aspect()
+                new_aspect.aspect_type = aspect_type
+                new_aspect.data = initial_data if initial_data is not None else struct_pb2.Struct()
+                mutate(new_aspect.data)
+                entry.aspects[aspect_key] = new_aspect
 
-            # Initialize request argument(s)  
             request = dataplex_v1.UpdateEntryRequest(
-                entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]), 
+                entry=entry,
+                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
                 allow_missing=False,
-                aspect_keys=[aspect_name]
+                aspect_keys=[aspect_key]
             )
-            # Make the request
             try:
                 response = client.update_entry(request=request)
-                logger.info(f"Aspect created: {response.name}")
-                return True
             except Exception as e:
+                self._invalidate_cached_entry(entry_name)
                 logger.error(f"Failed to create aspect: {e}")
                 return False
-
+            self._cache_entry(entry_name, aspect_type, response)
+            logger.info(f"Aspect created: {response.name}")
             return True
 
+    def _read_modify_write_table_aspect(self, table_fqn, mutate):
+        """Applies an in-place change to the table-level metadata aspect.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            mutate (callable): Called with the aspect data (dict-like) to modify in place
+
+        Returns:
+            bool: True if successful, False if the update failed
+
+        Raises:
+            Exception: If there is an error reading the entry
+        """
+        try:
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
+
+            return self._read_modify_write_aspect(entry_name, aspect_type, aspect_name, "", mutate)
+
         except Exception as e:
-            logger.error(f"Exception: {e}.")
+            logger.error(f"Failed to update aspect of table {table_fqn}: {e}")
             raise e
 
     def accept_table_draft_description(self, table_fqn):
@@ -410,15 +659,12 @@ class DataplexOperations:
             # Create a client
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
             
-            # Get project and dataset IDs
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
             # Set up aspect types and entry name
             aspect_types = [
-                f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+                self._aspect_type_fqn
             ]
             
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
             
             # Get the entry with the draft aspect
             request = dataplex_v1.GetEntryRequest(
@@ -431,13 +677,11 @@ class DataplexOperations:
             overview = None
             
             # Find the draft description in the custom aspect
-            for aspect_key, aspect in entry.aspects.items():
+            aspect_key, aspect = self._find_draft_aspect(entry)
+            if aspect is not None and "contents" in aspect.data:
                 logger.info(f"Processing aspect: {aspect_key}")
-                if aspect.aspect_type.endswith(f"""aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
-                    if "contents" in aspect.data:
-                        overview = aspect.data["contents"]
-                        logger.info(f"Found draft description: {overview[:50]}...")
-                        break
+                overview = aspect.data["contents"]
+                logger.info(f"Found draft description: {overview[:50]}...")
             
 
             if overview:
@@ -475,118 +719,140 @@ class DataplexOperations:
         Raises:
             Exception: If there is an error updating the draft description
         """
-        try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+        return self.update_columns_draft_descriptions(table_fqn, {column_name: description})
 
-            # Create new aspect content
-            new_aspect_content = {
-                #"certified": "false",
-                #"user-who-certified": "",
-                "contents": description,
-                "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "to-be-regenerated": "false",
-                #"human-comments": [],
-                #"negative-examples": [],
-                #"external-document-uri": "",
-                "is-accepted": "false"
-            }
+    def update_columns_draft_descriptions(self, table_fqn, descriptions):
+        """Updates the draft descriptions of several columns of a table in Dataplex.
 
-            logger.info(f"aspect_content: {new_aspect_content}")
+        All column aspects are read with one GetEntry and written with one
+        UpdateEntry whose aspect_keys cover every touched column.
 
-            # Create the aspect
-            new_aspect = dataplex_v1.Aspect()
-            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
-            aspect_types = [new_aspect.aspect_type]
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            descriptions (dict): Maps column names to their new draft descriptions
 
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+        Returns:
+            bool: True if successful
 
-            entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+        Raises:
+            Exception: If there is an error updating the draft descriptions
+        """
+        if not descriptions:
+            return True
+        try:
+            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            generation_date = _utc_now_iso()
 
-            # Check if the aspect already exists
-            try:
-                get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
-                entry = client.get_entry(request=get_request)
-            except Exception as e:
-                logger.error(f"Exception: {e}.")
-                raise e
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
+            aspect_keys = {column_name: f"{aspect_name}@Schema.{column_name}" for column_name in descriptions}
 
-            data_struct = struct_pb2.Struct()
-            data_struct.update(new_aspect_content)
-            new_aspect.data = data_struct
+            entry_name = self._build_entry_name(table_fqn)
 
-            for i in entry.aspects:
-                logger.info(f"""i: {i} path: "{entry.aspects[i].path}" """)
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating aspect {i} with new values")
-                    new_aspect.data = entry.aspects[i].data
-                    new_aspect.data.update({
-                        "contents": description,
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": "false",
-                        "is-accepted": "false"
-                    })
+            with _aspect_write_lock(entry_name):
+                entry = self._get_cached_entry(entry_name, aspect_type)
+                if entry is None or any(key not in entry.aspects for key in aspect_keys.values()):
+                    get_request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=[aspect_type])
+                    entry = client.get_entry(request=get_request)
 
-            new_entry = dataplex_v1.Entry()
-            new_entry.name = entry.name
-            new_entry.aspects[aspect_name] = new_aspect
+                # Existing column aspects, by path
+                existing_aspects = {}
+                for key, aspect in entry.aspects.items():
+                    if "@Schema." in key and key.split("@", 1)[0].endswith(self._aspect_key_suffix):
+                        existing_aspects[aspect.path] = aspect
 
-            # Initialize request argument(s)  
-            request = dataplex_v1.UpdateEntryRequest(
-                entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]), 
-                allow_missing=False,
-                aspect_keys=[aspect_name]
-            )
+                # The fetched entry is sent back with the column aspects updated in place
+                for column_name, description in descriptions.items():
+                    new_aspect_content = {
+                        "contents": description,
+                        "generation-date": generation_date,
+                        "to-be-regenerated": False,
+                        "is-accepted": False
+                    }
+                    logger.info("aspect_content for column %s: %s", column_name, new_aspect_content)
+
+                    existing_aspect = existing_aspects.get(f"Schema.{column_name}")
+                    if existing_aspect is not None:
+                        existing_aspect.data.update(new_aspect_content)
+                        if aspect_keys[column_name] not in entry.aspects:
+                            entry.aspects[aspect_keys[column_name]] = existing_aspect
+                    else:
+                        new_aspect = dataplex_v1.Aspect()
+                        new_aspect.aspect_type = aspect_type
+                        new_aspect.data = self._new_draft_aspect_struct(generation_date, False, description)
+                        entry.aspects[aspect_keys[column_name]] = new_aspect
+
+                request = dataplex_v1.UpdateEntryRequest(
+                    entry=entry,
+                    update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                    allow_missing=False,
+                    aspect_keys=list(aspect_keys.values())
+                )
 
-            # Make the request
-            try:
-                response = client.update_entry(request=request)
-                logger.info(f"Aspect created: {response.name}")
+                # Make the request
+                try:
+                    response = client.update_entry(request=request)
+                except Exception as e:
+                    self._invalidate_cached_entry(entry_name)
+                    logger.error(f"Failed to create aspect: {e}")
+                    return False
+                self._cache_entry(entry_name, aspect_type, response)
+                logger.info(f"Updated {len(aspect_keys)} column aspects of {response.name}")
                 return True
-            except Exception as e:
-                logger.error(f"Failed to create aspect: {e}")
-                return False
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
-    def check_if_table_should_be_regenerated(self, table_fqn):
-        """Checks if a table should be regenerated.
+    def check_regeneration_flags(self, table_fqn, column_names=None):
+        """Checks if a table and some of its columns should be regenerated.
+
+        The table entry is read once and every flag is taken from its aspects.
 
         Args:
             table_fqn (str): The fully qualified name of the table
+            column_names (list, optional): The columns to check
 
         Returns:
-            bool: True if the table should be regenerated
+            dict: {"table": bool, "columns": {column_name: bool}}
         """
+        column_names = list(column_names or [])
+        flags = {"table": False, "columns": dict.fromkeys(column_names, False)}
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-
-            entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
+            entry_name = self._build_entry_name(table_fqn)
 
             try:
-                get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
+                get_request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=[self._aspect_type_fqn])
                 entry = client.get_entry(request=get_request)
             except Exception as e:
                 logger.error(f"Exception: {e}.")
                 raise e
 
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
-                    data_dict = entry.aspects[i].data
-                    return data_dict["to-be-regenerated"] == True
+            _, aspect = self._find_draft_aspect(entry)
+            if aspect is not None:
+                flags["table"] = _flag_is_set(aspect.data.get("to-be-regenerated"))
+            for column_name in column_names:
+                _, aspect = self._find_draft_aspect(entry, column_name)
+                if aspect is not None:
+                    flags["columns"][column_name] = _flag_is_set(aspect.data.get("to-be-regenerated"))
 
-            return False
+            return flags
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
-            return False
+            return flags
+
+    def check_if_table_should_be_regenerated(self, table_fqn):
+        """Checks if a table should be regenerated.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            bool: True if the table should be regenerated
+        """
+        return self.check_regeneration_flags(table_fqn)["table"]
 
     def check_if_column_should_be_regenerated(self, table_fqn, column_name):
         """Checks if a column should be regenerated.
@@ -598,31 +864,7 @@ class DataplexOperations:
         Returns:
             bool: True if the column should be regenerated
         """
-        try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-
-            entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
-
-            try:
-                get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
-                entry = client.get_entry(request=get_request)
-            except Exception as e:
-                logger.error(f"Exception: {e}.")
-                raise e
-
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    data_dict = entry.aspects[i].data
-                    return data_dict["to-be-regenerated"] == True
-
-            return False
-
-        except Exception as e:
-            logger.error(f"Exception: {e}.")
-            return False
+        return self.check_regeneration_flags(table_fqn, [column_name])["columns"][column_name]
 
     def get_column_comment(self, table_fqn, column_name, comment_number=None):
         """Gets comments for a column.
@@ -637,23 +879,21 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
             aspect_types = [aspect_type]
 
             request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
             entry = client.get_entry(request=request)
 
             comments = []
-            for aspect in entry.aspects:
-                if aspect.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[aspect].path == f"Schema.{column_name}":
-                    if "human-comments" in entry.aspects[aspect].data:
-                        if comment_number is None:
-                            comments.extend(entry.aspects[aspect].data["human-comments"])
-                        else:
-                            comments.append(entry.aspects[aspect].data["human-comments"][comment_number])
+            _, aspect = self._find_draft_aspect(entry, column_name)
+            if aspect is not None and "human-comments" in aspect.data:
+                if comment_number is None:
+                    comments.extend(aspect.data["human-comments"])
+                else:
+                    comments.append(aspect.data["human-comments"][comment_number])
 
             return comments
 
@@ -673,23 +913,21 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
             aspect_types = [aspect_type]
 
             request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
             entry = client.get_entry(request=request)
 
             comments = []
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
-                    if "human-comments" in aspect.data:
-                        if comment_number is None:
-                            comments.extend(aspect.data["human-comments"])
-                        else:
-                            comments.append(aspect.data["human-comments"][comment_number])
+            _, aspect = self._find_draft_aspect(entry)
+            if aspect is not None and "human-comments" in aspect.data:
+                if comment_number is None:
+                    comments.extend(aspect.data["human-comments"])
+                else:
+                    comments.append(aspect.data["human-comments"][comment_number])
 
             return comments
 
@@ -708,13 +946,27 @@ class DataplexOperations:
         """
         try:
             project_id, dataset_id, _ = self._client._utils.split_table_fqn(table_fqn)
-            return str(self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_dataset(
-                f"{project_id}.{dataset_id}"
-            ).location).lower()
+            return self._get_dataset_location_cached(project_id, dataset_id)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
+    def _format_entry_name(self, table_fqn):
+        """Builds the Dataplex entry name of a BigQuery table. Use _build_entry_name instead."""
+        project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+        return _ENTRY_NAME_TEMPLATE.format(
+            project_id=project_id,
+            location=self._get_dataset_location(table_fqn),
+            dataset_id=dataset_id,
+            table_id=table_id
+        )
+
+    def _fetch_dataset_location(self, project_id, dataset_id):
+        """Reads the location of a dataset from BigQuery. Use _get_dataset_location instead."""
+        return str(self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_dataset(
+            f"{project_id}.{dataset_id}"
+        ).location).lower()
+
     def accept_column_draft_description(self, table_fqn, column_name):
         """Move description from draft aspect to dataplex Overview and BQ for a specific column.
 
@@ -732,10 +984,9 @@ class DataplexOperations:
             # Create a client
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
 
-            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            aspect_types = [self._aspect_type_fqn]
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
 
             request = dataplex_v1.GetEntryRequest(
                 name=entry_name,
@@ -746,15 +997,11 @@ class DataplexOperations:
             
             entry = client.get_entry(request=request)
             
-            for aspect_key, aspect in entry.aspects.items():
+            aspect_key, aspect = self._find_draft_aspect(entry, column_name)
+            if aspect is not None and "contents" in aspect.data:
                 logger.info(f"Processing aspect: {aspect_key}")
-                logger.info(f"Aspect path: {aspect.path}")
-                
-                if aspect.aspect_type.endswith(f"""aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == f"Schema.{column_name}":
-                    if "contents" in aspect.data:
-                        overview = aspect.data["contents"]
-                        logger.info(f"Found draft description for column {column_name}: {overview[:50]}...")
-                        break
+                overview = aspect.data["contents"]
+                logger.info(f"Found draft description for column {column_name}: {overview[:50]}...")
 
             if overview:
                 success = self._client._bigquery_ops.update_column_description(table_fqn, column_name, overview)
@@ -772,42 +1019,148 @@ class DataplexOperations:
             logger.error(f"Exception in accept_column_draft_description: {e}")
             return False
 
-    def get_table_quality(self, use_data_quality, table_fqn):
-        """Gets the quality information for a table from Dataplex.
+    def get_table_metadata_bundle(self, table_fqn, use_data_quality=True, use_profile=True,
+                                  use_lineage_tables=True, use_lineage_processes=True):
+        """Gets the quality, profile and lineage information of a table with one request.
 
         Args:
-            use_data_quality (bool): Whether to use data quality information
             table_fqn (str): The fully qualified name of the table
+            use_data_quality (bool): Whether to get data quality information
+            use_profile (bool): Whether to get profile information
+            use_lineage_tables (bool): Whether to get source table information
+            use_lineage_processes (bool): Whether to get job source information
 
         Returns:
-            dict: Table quality information or None if not available/enabled
+            dict: The keys 'quality', 'profile', 'table_sources' and 'job_sources', each
+                holding the aspect data or None if not available/enabled
         """
-        if not use_data_quality:
-            return None
-            
+        wanted = {
+            "quality": use_data_quality,
+            "profile": use_profile,
+            "table_sources": use_lineage_tables,
+            "job_sources": use_lineage_processes,
+        }
+        bundle = dict.fromkeys(wanted)
+        bundle.update(self._get_system_aspects(table_fqn, [name for name, use in wanted.items() if use]))
+        return bundle
+
+    def get_tables_metadata_bundles(self, table_fqns, use_data_quality=True, use_profile=True,
+                                    use_lineage_tables=True, use_lineage_processes=True, max_workers=10):
+        """Gets the metadata bundles of several tables concurrently.
+
+        Dataplex has no batch read for entry aspects, so the GetEntry calls are
+        issued in parallel instead. The system aspects cache is bounded, so callers
+        working through many tables should use the returned bundles rather than
+        rely on later per-table reads being served from memory.
+
+        Args:
+            table_fqns (list): The fully qualified names of the tables
+            use_data_quality (bool): Whether to get data quality information
+            use_profile (bool): Whether to get profile information
+            use_lineage_tables (bool): Whether to get source table information
+            use_lineage_processes (bool): Whether to get job source information
+            max_workers (int): Maximum number of tables read at once
+
+        Returns:
+            dict: The bundle of each table (see get_table_metadata_bundle), by table_fqn
+        """
+        table_fqns = list(dict.fromkeys(table_fqns))
+        if not table_fqns:
+            return {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            bundles = executor.map(
+                lambda table_fqn: self.get_table_metadata_bundle(
+                    table_fqn, use_data_quality, use_profile, use_lineage_tables, use_lineage_processes
+                ),
+                table_fqns
+            )
+            return dict(zip(table_fqns, bundles))
+
+    def _get_system_aspects(self, table_fqn, names):
+        """Reads several system aspects of a table with a single GetEntry.
+
+        Aspects read in the last _SYSTEM_ASPECTS_CACHE_TTL_SECONDS are served from
+        memory; only the others are requested.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            names (list): Keys of _SYSTEM_ASPECT_TYPES to read
+
+        Returns:
+            dict: The aspect data of each name, or None if the table has no such aspect.
+                The data is shared between callers and must not be mutated.
+        """
+        result = dict.fromkeys(names)
+        now = time.monotonic()
+        missing = []
+        with self._system_aspects_cache_lock:
+            for name in names:
+                cached = self._system_aspects_cache.get((table_fqn, name))
+                if cached is not None and cached[0] > now:
+                    result[name] = cached[1]
+                else:
+                    missing.append(name)
+        if not missing:
+            return result
+
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = "projects/dataplex-types/locations/global/aspectTypes/data_quality"
-            aspect_types = [aspect_type]
 
             request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
+                name=self._build_entry_name(table_fqn),
                 view=dataplex_v1.EntryView.CUSTOM,
-                aspect_types=aspect_types
+                aspect_types=[_SYSTEM_ASPECT_TYPES[name] for name in missing]
             )
-            
             entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith("global.data_quality") and aspect.path == "":
-                    return dict(aspect.data)
-            return None
-            
+
+            for name in missing:
+                aspect = entry.aspects.get(_SYSTEM_ASPECT_KEYS[name])
+                if aspect is None:
+                    aspect = self._find_system_aspect(entry, name)
+                if aspect is not None and aspect.path == "":
+                    result[name] = json_format.MessageToDict(dataplex_v1.Aspect.pb(aspect).data, preserving_proto_field_name=True)
+
+            with self._system_aspects_cache_lock:
+                if len(self._system_aspects_cache) >= _ENTRY_CACHE_MAX_SIZE:
+                    self._system_aspects_cache.clear()
+                for name in missing:
+                    self._system_aspects_cache[(table_fqn, name)] = (now + _SYSTEM_ASPECTS_CACHE_TTL_SECONDS, result[name])
+            return result
+
         except Exception as e:
-            logger.error(f"Error getting table quality for {table_fqn}: {e}")
+            logger.error(f"Error getting {', '.join(missing)} of {table_fqn}: {e}")
+            return result
+
+    @staticmethod
+    def _find_system_aspect(entry, name):
+        """Scans an entry for a system aspect keyed by project number instead of "dataplex-types".
+
+        Args:
+            entry (dataplex_v1.Entry): The entry to scan
+            name (str): Key of _SYSTEM_ASPECT_TYPES to find
+
+        Returns:
+            dataplex_v1.Aspect: The aspect, or None if the entry does not have it.
+        """
+        suffix = _SYSTEM_ASPECT_KEYS[name][len("dataplex-types"):]
+        for aspect_key, aspect in entry.aspects.items():
+            if aspect_key.endswith(suffix) and aspect.path == "":
+                return aspect
+        return None
+
+    def get_table_quality(self, use_data_quality, table_fqn):
+        """Gets the quality information for a table from Dataplex.
+
+        Args:
+            use_data_quality (bool): Whether to use data quality information
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            dict: Table quality information or None if not available/enabled
+        """
+        if not use_data_quality:
             return None
+        return self._get_system_aspects(table_fqn, ["quality"])["quality"]
 
     def get_table_profile(self, use_profile, table_fqn):
         """Gets the profile information for a table from Dataplex.
@@ -821,30 +1174,7 @@ class DataplexOperations:
         """
         if not use_profile:
             return None
-            
-        try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = "projects/dataplex-types/locations/global/aspectTypes/data_profile"
-            aspect_types = [aspect_type]
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,
-                aspect_types=aspect_types
-            )
-            
-            entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith("global.data_profile") and aspect.path == "":
-                    return dict(aspect.data)
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting table profile for {table_fqn}: {e}")
-            return None
+        return self._get_system_aspects(table_fqn, ["profile"])["profile"]
 
     def get_table_sources_info(self, use_lineage_tables, table_fqn):
         """Gets source table information from Dataplex.
@@ -858,30 +1188,7 @@ class DataplexOperations:
         """
         if not use_lineage_tables:
             return None
-            
-        try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = "projects/dataplex-types/locations/global/aspectTypes/lineage"
-            aspect_types = [aspect_type]
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,
-                aspect_types=aspect_types
-            )
-            
-            entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith("global.lineage") and aspect.path == "":
-                    return dict(aspect.data)
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting table sources info for {table_fqn}: {e}")
-            return None
+        return self._get_system_aspects(table_fqn, ["table_sources"])["table_sources"]
 
     def get_job_sources(self, use_lineage_processes, table_fqn):
         """Gets job source information from Dataplex.
@@ -895,30 +1202,7 @@ class DataplexOperations:
         """
         if not use_lineage_processes:
             return None
-            
-        try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = "projects/dataplex-types/locations/global/aspectTypes/process_lineage"
-            aspect_types = [aspect_type]
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,
-                aspect_types=aspect_types
-            )
-            
-            entry = client.get_entry(request=request)
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith("global.process_lineage") and aspect.path == "":
-                    return dict(aspect.data)
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting job sources for {table_fqn}: {e}")
-            return None 
+        return self._get_system_aspects(table_fqn, ["job_sources"])["job_sources"]
 
     def mark_table_for_regeneration(self, table_fqn: str) -> bool:
         """Marks a table for regeneration by setting the to-be-regenerated flag in its metadata.
@@ -934,12 +1218,11 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
             aspect_types = [aspect_type]
 
             # Get existing entry with aspects
@@ -955,30 +1238,19 @@ class DataplexOperations:
             new_aspect.aspect_type = aspect_type
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path=="":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
-                    new_aspect.data.update({
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": True
-                    })
-                    break
+            existing_key, existing_aspect = self._find_draft_aspect(entry)
+            if existing_aspect is not None:
+                logger.info(f"Updating existing aspect {existing_key}")
+                new_aspect.data = existing_aspect.data
+                new_aspect.data.update({
+                    "generation-date": _utc_now_iso(),
+                    "to-be-regenerated": True
+                })
             else:
                 # No existing aspect found, create new one
-                aspect_data = {
-                    "certified": "false",
-                    "user-who-certified": "",
-                    "contents": "",
-                    "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to-be-regenerated": True,
-                    "human-comments": [],
-                    "negative-examples": [],
-                    "external-document-uri": ""
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+                new_aspect.data = self._new_draft_aspect_struct(
+                    _utc_now_iso(), True
+                )
 
             # Create new entry with updated aspect
             new_entry = dataplex_v1.Entry()
@@ -995,6 +1267,7 @@ class DataplexOperations:
 
             # Make the request
             response = client.update_entry(request=request)
+            self._invalidate_cached_entry(entry_name)
             logger.info(f"Successfully marked table {table_fqn} for regeneration")
             return True
 
@@ -1016,12 +1289,11 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
             aspect_types = [aspect_type]
 
             # Get existing entry with aspects
@@ -1037,30 +1309,19 @@ class DataplexOperations:
             new_aspect.aspect_type = aspect_type
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path=="":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
-                    new_aspect.data.update({
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": False
-                    })
-                    break
+            existing_key, existing_aspect = self._find_draft_aspect(entry)
+            if existing_aspect is not None:
+                logger.info(f"Updating existing aspect {existing_key}")
+                new_aspect.data = existing_aspect.data
+                new_aspect.data.update({
+                    "generation-date": _utc_now_iso(),
+                    "to-be-regenerated": False
+                })
             else:
                 # No existing aspect found, create new one
-                aspect_data = {
-                    "certified": "false",
-                    "user-who-certified": "",
-                    "contents": "",
-                    "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to-be-regenerated": False,
-                    "human-comments": [],
-                    "negative-examples": [],
-                    "external-document-uri": ""
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+                new_aspect.data = self._new_draft_aspect_struct(
+                    _utc_now_iso(), False
+                )
 
             # Create new entry with updated aspect
             new_entry = dataplex_v1.Entry()
@@ -1077,6 +1338,7 @@ class DataplexOperations:
 
             # Make the request
             response = client.update_entry(request=request)
+            self._invalidate_cached_entry(entry_name)
             logger.info(f"Successfully marked table {table_fqn} as regenerated")
             return True
 
@@ -1099,12 +1361,11 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = f"{self._aspect_key}@Schema.{column_name}"
             aspect_types = [aspect_type]
 
             # Get existing entry
@@ -1121,30 +1382,19 @@ class DataplexOperations:
             new_aspect.path = f"Schema.{column_name}"
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
-                    new_aspect.data.update({
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": True
-                    })
-                    break
+            existing_key, existing_aspect = self._find_draft_aspect(entry, column_name)
+            if existing_aspect is not None:
+                logger.info(f"Updating existing aspect {existing_key}")
+                new_aspect.data = existing_aspect.data
+                new_aspect.data.update({
+                    "generation-date": _utc_now_iso(),
+                    "to-be-regenerated": True
+                })
             else:
                 # No existing aspect found, create new one
-                aspect_data = {
-                    "certified": "false",
-                    "user-who-certified": "",
-                    "contents": "",
-                    "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to-be-regenerated": True,
-                    "human-comments": [],
-                    "negative-examples": [],
-                    "external-document-uri": ""
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+                new_aspect.data = self._new_draft_aspect_struct(
+                    _utc_now_iso(), True
+                )
 
             # Create new entry with updated aspect
             new_entry = dataplex_v1.Entry()
@@ -1161,6 +1411,7 @@ class DataplexOperations:
 
             # Make the request
             response = client.update_entry(request=request)
+            self._invalidate_cached_entry(entry_name)
             logger.info(f"Successfully marked column {column_name} in table {table_fqn} for regeneration")
             return True
 
@@ -1183,12 +1434,11 @@ class DataplexOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = f"{self._aspect_key}@Schema.{column_name}"
             aspect_types = [aspect_type]
 
             # Get existing entry
@@ -1205,30 +1455,19 @@ class DataplexOperations:
             new_aspect.path = f"Schema.{column_name}"
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
-                    new_aspect.data.update({
-                        "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                        "to-be-regenerated": False
-                    })
-                    break
+            existing_key, existing_aspect = self._find_draft_aspect(entry, column_name)
+            if existing_aspect is not None:
+                logger.info(f"Updating existing aspect {existing_key}")
+                new_aspect.data = existing_aspect.data
+                new_aspect.data.update({
+                    "generation-date": _utc_now_iso(),
+                    "to-be-regenerated": False
+                })
             else:
                 # No existing aspect found, create new one
-                aspect_data = {
-                    "certified": "false",
-                    "user-who-certified": "",
-                    "contents": "",
-                    "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "to-be-regenerated": False,
-                    "human-comments": [],
-                    "negative-examples": [],
-                    "external-document-uri": ""
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+                new_aspect.data = self._new_draft_aspect_struct(
+                    _utc_now_iso(), False
+                )
 
             # Create new entry with updated aspect
             new_entry = dataplex_v1.Entry()
@@ -1245,9 +1484,108 @@ class DataplexOperations:
 
             # Make the request
             response = client.update_entry(request=request)
+            self._invalidate_cached_entry(entry_name)
             logger.info(f"Successfully marked column {column_name} in table {table_fqn} as regenerated")
             return True
 
         except Exception as e:
             logger.error(f"Failed to mark column {column_name} in table {table_fqn} as regenerated: {str(e)}")
-            return False 
\ No newline at end of file
+            return False 
+
+    def mark_objects_for_regeneration(self, objects, max_workers=8):
+        """Marks several tables and columns for regeneration in as few calls as possible.
+
+        Objects belonging to the same table are written with a single GetEntry and a
+        single UpdateEntry call. Different tables are processed concurrently.
+
+        Args:
+            objects (list): Tuples of (table_fqn, column_name). column_name is None to
+                mark the table itself.
+            max_workers (int): Maximum number of tables updated concurrently.
+
+        Returns:
+            list: One dict per object with keys 'table_fqn', 'column_name' and 'success'.
+        """
+        columns_by_table = {}
+        for table_fqn, column_name in objects:
+            columns_by_table.setdefault(table_fqn, []).append(column_name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            successes = dict(zip(
+                columns_by_table,
+                executor.map(lambda item: self._mark_table_objects_for_regeneration(*item), columns_by_table.items())
+            ))
+
+        return [
+            {"table_fqn": table_fqn, "column_name": column_name, "success": successes[table_fqn]}
+            for table_fqn, column_name in objects
+        ]
+
+    def _mark_table_objects_for_regeneration(self, table_fqn, column_names):
+        """Sets the to-be-regenerated flag on a table and/or its columns with one update.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            column_names (list): Column names to mark. None marks the table itself.
+
+        Returns:
+            bool: True if the entry was updated, False otherwise.
+        """
+        try:
+            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = self._aspect_type_fqn
+            aspect_name = self._aspect_key
+
+            request = dataplex_v1.GetEntryRequest(
+                name=entry_name,
+                view=dataplex_v1.EntryView.CUSTOM,
+                aspect_types=[aspect_type]
+            )
+            entry = client.get_entry(request=request)
+
+            # Index the existing aspects by path ("" for the table, "Schema.<column>" for columns)
+            existing_aspects = {
+                entry.aspects[key].path: entry.aspects[key]
+                for key in entry.aspects
+                if key.split("@")[0].endswith(self._aspect_key_suffix)
+            }
+
+            generation_date = _utc_now_iso()
+            new_entry = dataplex_v1.Entry()
+            new_entry.name = entry_name
+            aspect_keys = []
+            for column_name in dict.fromkeys(column_names):
+                path = f"Schema.{column_name}" if column_name else ""
+                key = f"{aspect_name}@{path}" if column_name else aspect_name
+
+                new_aspect = dataplex_v1.Aspect()
+                new_aspect.aspect_type = aspect_type
+                new_aspect.path = path
+                if path in existing_aspects:
+                    new_aspect.data = existing_aspects[path].data
+                    new_aspect.data.update({
+                        "generation-date": generation_date,
+                        "to-be-regenerated": True
+                    })
+                else:
+                    new_aspect.data = self._new_draft_aspect_struct(generation_date, True)
+
+                new_entry.aspects[key] = new_aspect
+                aspect_keys.append(key)
+
+            request = dataplex_v1.UpdateEntryRequest(
+                entry=new_entry,
+                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                allow_missing=False,
+                aspect_keys=aspect_keys
+            )
+            client.update_entry(request=request)
+            self._invalidate_cached_entry(entry_name)
+            logger.info(f"Successfully marked {len(aspect_keys)} objects in table {table_fqn} for regeneration")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to mark objects in table {table_fqn} for regeneration: {str(e)}")
+            return False
@@ -90,7 +90,7 @@ class PromptManager:
                 table_description_prompt + constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"]
             )
 
-            logger.info(f"Table description prompt: {table_description_prompt}")
+            logger.info("Table description prompt: %s", table_description_prompt)
             return table_description_prompt
         except Exception as e:
             logger.error(f"Exception: {e}.")
@@ -142,7 +142,7 @@ class PromptManager:
             column_description_prompt = (
                 column_description_prompt + constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"]
             )
-            logger.info(f"Column description prompt: {column_description_prompt}")
+            logger.info("Column description prompt: %s", column_description_prompt)
             return column_description_prompt
         except Exception as e:
             logger.error(f"Exception: {e}.")
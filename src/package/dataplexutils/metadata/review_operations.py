@@ -21,14 +21,15 @@ import logging
 import toml
 import pkgutil
 import datetime
-import uuid
 import traceback
 
 # Cloud imports
 from google.cloud import dataplex_v1
 from google.protobuf import field_mask_pb2, struct_pb2
 import google.api_core.exceptions
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from .dataplex_operations import _utc_now_iso
 
 # Load constants
 constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
@@ -46,6 +47,8 @@ class ReviewOperations:
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        # Aspect keys are "<project>.global.<aspect type>[@Schema.<column>]"
+        self._aspect_key_suffix = f"global.{constants['ASPECT_TEMPLATE']['name']}"
 
     def build_search_query_for_review(self, dataset_fqn: str, search_query: str = None) -> str:
         """Build an effective query that always includes the dataset filter.
@@ -177,7 +180,7 @@ class ReviewOperations:
                 
                     # Check for column-level metadata tags
                     for aspect_key, aspect in entry.aspects.items():
-                        if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path.startswith("Schema."):
+                        if aspect_key.endswith(self._aspect_key_suffix) and aspect.path.startswith("Schema."):
                             # Extract column name from path
                             column_name = aspect.path.replace("Schema.", "")
                             logger.info(f"Found column metadata for {column_name}")
@@ -231,9 +234,8 @@ class ReviewOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
             
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_types = [aspect_type]
@@ -267,17 +269,18 @@ class ReviewOperations:
             # Handle table details
             current_description = self._client._bigquery_ops.get_table_description(table_fqn)
             draft_description = None
+            now_iso = datetime.datetime.now().isoformat()
             metadata = {
                 'certified': False,
                 'user_who_certified': '',
-                'generation_date': datetime.datetime.now().isoformat(),
+                'generation_date': now_iso,
                 'to_be_regenerated': False,
                 'external_document_uri': ''
             }
 
             # Get table-level aspect data
             for aspect_key, aspect in entry.aspects.items():
-                if (aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") 
+                if (aspect_key.endswith(self._aspect_key_suffix) 
                     and aspect.path == "" 
                     and hasattr(aspect, 'data')
                     and aspect.data):
@@ -289,7 +292,7 @@ class ReviewOperations:
                         metadata.update({
                             'certified': aspect_data.get('certified', False),
                             'user_who_certified': aspect_data.get('user-who-certified', ''),
-                            'generation_date': aspect_data.get('generation-date', datetime.datetime.now().isoformat()),
+                            'generation_date': aspect_data.get('generation-date', now_iso),
                             'to_be_regenerated': aspect_data.get('to-be-regenerated', False),
                             'external_document_uri': aspect_data.get('external-document-uri', '')
                         })
@@ -309,8 +312,9 @@ class ReviewOperations:
             
             for column in schema:
                 # Check if column has any aspects
+                column_suffix = f"{self._aspect_key_suffix}@Schema.{column.name}"
                 has_aspects = any(
-                    aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column.name}""")
+                    aspect_key.endswith(column_suffix)
                     for aspect_key in entry.aspects.keys()
                 )
                 
@@ -327,7 +331,7 @@ class ReviewOperations:
                 "draftDescription": draft_description or "",
                 "isHtml": False,
                 "status": "draft" if draft_description else "current",
-                "lastModified": metadata.get('generation_date', datetime.datetime.now().isoformat()),
+                "lastModified": metadata.get('generation_date', now_iso),
                 "comments": all_comments,
                 "markedForRegeneration": metadata.get('to_be_regenerated', False),
                 "metadata": metadata,
@@ -356,10 +360,11 @@ class ReviewOperations:
             logger.debug(f"Getting column details for {column.name}")
             current_description = column.description or ""
             draft_description = None
+            now_iso = datetime.datetime.now().isoformat()
             metadata = {
                 'certified': False,
                 'user_who_certified': '',
-                'generation_date': datetime.datetime.now().isoformat(),
+                'generation_date': now_iso,
                 'to_be_regenerated': False,
                 'external_document_uri': ''
             }
@@ -367,9 +372,11 @@ class ReviewOperations:
             comments = []
 
             # Find the draft description in the custom aspect for the specific column
+            column_suffix = f"{self._aspect_key_suffix}@Schema.{column.name}"
+            column_path = f"Schema.{column.name}"
             for aspect_key, aspect in entry.aspects.items():
-                if (aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column.name}""") 
-                    and aspect.path == f"Schema.{column.name}"
+                if (aspect_key.endswith(column_suffix) 
+                    and aspect.path == column_path
                     and hasattr(aspect, 'data')):
                     
                     aspect_data = aspect.data
@@ -384,7 +391,7 @@ class ReviewOperations:
                         metadata.update({
                             'certified': aspect_data.get('certified', False),
                             'user_who_certified': aspect_data.get('user-who-certified', ''),
-                            'generation_date': aspect_data.get('generation-date', datetime.datetime.now().isoformat()),
+                            'generation_date': aspect_data.get('generation-date', now_iso),
                             'to_be_regenerated': aspect_data.get('to-be-regenerated', False),
                             'external_document_uri': aspect_data.get('external-document-uri', '')
                         })
@@ -408,7 +415,7 @@ class ReviewOperations:
                 "draftDescription": draft_description or "",
                 "isHtml": False,
                 "status": "draft" if draft_description else "current",
-                "lastModified": metadata.get('generation_date', datetime.datetime.now().isoformat()),
+                "lastModified": metadata.get('generation_date', now_iso),
                 "comments": comments,
                 "markedForRegeneration": metadata.get('to_be_regenerated', False),
                 "metadata": metadata,
@@ -434,11 +441,10 @@ class ReviewOperations:
             logger.info(f"=== START: get_comments_to_table_draft_description for {table_fqn} ===")
             
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
 
             request = dataplex_v1.GetEntryRequest(
                 name=entry_name,
@@ -448,7 +454,7 @@ class ReviewOperations:
             entry = client.get_entry(request=request)
 
             for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
+                if aspect_key.endswith(self._aspect_key_suffix) and aspect.path == "":
                     if "human-comments" in aspect.data:
                         raw_comments = aspect.data["human-comments"]
                         validated_comments = []
@@ -475,11 +481,10 @@ class ReviewOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
 
             request = dataplex_v1.GetEntryRequest(
                 name=entry_name,
@@ -489,7 +494,7 @@ class ReviewOperations:
             entry = client.get_entry(request=request)
 
             for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
+                if aspect_key.endswith(self._aspect_key_suffix) and aspect.path == "":
                     if "negative-examples" in aspect.data:
                         return aspect.data["negative-examples"]
             
@@ -499,6 +504,50 @@ class ReviewOperations:
             logger.error(f"Error getting negative examples for table {table_fqn}: {str(e)}")
             return []
 
+    def get_review_state(self, table_fqn):
+        """Get the draft description, comments and negative examples for a table.
+
+        Reads all three fields from a single GetEntry call instead of one call per field.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            tuple: (draft description or None, list of comments, list of negative examples).
+                The empty state (None, [], []) is only returned when the table has no
+                draft aspect.
+
+        Raises:
+            Exception: If the entry cannot be read. Callers that write the state back
+                must not treat a failed read as an empty draft.
+        """
+        try:
+            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
+
+            request = dataplex_v1.GetEntryRequest(
+                name=entry_name,
+                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
+                aspect_types=[aspect_type]
+            )
+            entry = client.get_entry(request=request)
+
+            for aspect_key, aspect in entry.aspects.items():
+                if aspect_key.endswith(self._aspect_key_suffix) and aspect.path == "":
+                    description = aspect.data.get("contents")
+                    comments = [c for c in aspect.data.get("human-comments", []) if isinstance(c, str)]
+                    negative_examples = list(aspect.data.get("negative-examples", []))
+                    return description, comments, negative_examples
+
+            return None, [], []
+
+        except Exception as e:
+            logger.error(f"Error getting review state for table {table_fqn}: {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            raise e
+
     def add_comment_to_table_draft_description(self, table_fqn, comment):
         """Add a comment to a table's draft description.
 
@@ -511,11 +560,10 @@ class ReviewOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
             
             new_aspect = dataplex_v1.Aspect()
             new_aspect.aspect_type = aspect_type
@@ -530,7 +578,7 @@ class ReviewOperations:
                 
                 aspect_found = False
                 for i in entry.aspects:
-                    if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
+                    if i.endswith(self._aspect_key_suffix) and entry.aspects[i].path == "":
                         aspect_found = True
                         new_aspect.data = entry.aspects[i].data
                         existing_comments = list(new_aspect.data.get("human-comments", []))
@@ -542,16 +590,14 @@ class ReviewOperations:
                     aspect_data = {
                         "human-comments": [comment]
                     }
-                    data_struct = struct_pb2.Struct()
-                    data_struct.update(aspect_data)
+                    data_struct = ParseDict(aspect_data, struct_pb2.Struct())
                     new_aspect.data = data_struct
                 
             except google.api_core.exceptions.NotFound:
                 aspect_data = {
                     "human-comments": [comment]
                 }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
+                data_struct = ParseDict(aspect_data, struct_pb2.Struct())
                 new_aspect.data = data_struct
             
             new_entry = dataplex_v1.Entry()
@@ -566,6 +612,7 @@ class ReviewOperations:
             )
             
             response = client.update_entry(request=request)
+            self._client._dataplex_ops._invalidate_cached_entry(entry_name)
             return True
             
         except Exception as e:
@@ -573,6 +620,33 @@ class ReviewOperations:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return False
 
+    def add_negative_example_to_table_draft_description(self, table_fqn, example):
+        """Add a negative example to a table's draft description.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            example (str): The negative example to add
+
+        Returns:
+            bool: True if successful
+        """
+        def append_example(aspect_data):
+            negative_examples = list(aspect_data.get("negative-examples", []))
+            negative_examples.append(example)
+            aspect_data.update({
+                "negative-examples": negative_examples,
+                "generation-date": _utc_now_iso(),
+                "to-be-regenerated": False,
+                "is-accepted": False
+            })
+
+        try:
+            return self._client._dataplex_ops._read_modify_write_table_aspect(table_fqn, append_example)
+        except Exception as e:
+            logger.error(f"Error adding negative example to table {table_fqn}: {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            return False
+
     def add_comment_to_column_draft_description(self, table_fqn, column_name, comment):
         """Add a comment to a column's draft description.
 
@@ -588,11 +662,10 @@ class ReviewOperations:
             logger.info(f"=== START: add_comment_to_column_draft_description for {table_fqn}.{column_name} ===")
             
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
 
             new_aspect = dataplex_v1.Aspect()
             new_aspect.aspect_type = aspect_type
@@ -607,8 +680,10 @@ class ReviewOperations:
                 entry = client.get_entry(request=request)
                 
                 found_aspect = False
+                column_suffix = f"{self._aspect_key_suffix}@Schema.{column_name}"
+                column_path = f"Schema.{column_name}"
                 for i in entry.aspects:
-                    if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
+                    if i.endswith(column_suffix) and entry.aspects[i].path == column_path:
                         found_aspect = True
                         new_aspect.data = entry.aspects[i].data
                         existing_comments = list(new_aspect.data.get("human-comments", []))
@@ -620,16 +695,14 @@ class ReviewOperations:
                     aspect_data = {
                         "human-comments": [comment]
                     }
-                    data_struct = struct_pb2.Struct()
-                    data_struct.update(aspect_data)
+                    data_struct = ParseDict(aspect_data, struct_pb2.Struct())
                     new_aspect.data = data_struct
 
             except google.api_core.exceptions.NotFound:
                 aspect_data = {
                     "human-comments": [comment]
                 }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
+                data_struct = ParseDict(aspect_data, struct_pb2.Struct())
                 new_aspect.data = data_struct
 
             new_entry = dataplex_v1.Entry()
@@ -644,6 +717,7 @@ class ReviewOperations:
             )
             
             response = client.update_entry(request=request)
+            self._client._dataplex_ops._invalidate_cached_entry(entry_name)
             logger.info("Successfully updated entry")
             return True
 
@@ -663,11 +737,10 @@ class ReviewOperations:
         """
         try:
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
 
             request = dataplex_v1.GetEntryRequest(
                 name=entry_name,
@@ -677,7 +750,7 @@ class ReviewOperations:
             entry = client.get_entry(request=request)
 
             for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
+                if aspect_key.endswith(self._aspect_key_suffix) and aspect.path == "":
                     return aspect.data["contents"]
 
             return None
@@ -698,11 +771,10 @@ class ReviewOperations:
         try:
             logger.debug(f"Getting draft description for column {column_name}")
             client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
             aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._client._dataplex_ops._build_entry_name(table_fqn)
 
             request = dataplex_v1.GetEntryRequest(
                 name=entry_name,
@@ -724,7 +796,7 @@ class ReviewOperations:
                 for aspect_key, aspect in entry.aspects.items():
                     if pattern in aspect_key and hasattr(aspect, 'data'):
                         logger.debug(f"Found aspect for column {column_name}: {aspect_key}")
-                        logger.debug(f"Aspect data: {aspect.data}")
+                        logger.debug("Aspect data: %s", aspect.data)
                         if aspect.data and isinstance(aspect.data, dict) and "contents" in aspect.data:
                             return aspect.data["contents"]
 
@@ -822,10 +894,12 @@ class ReviewOperations:
                 update_mask = field_mask_pb2.FieldMask(paths=["aspects"])
                 request = dataplex_v1.UpdateEntryRequest(
                     entry=entry,
-                    update_mask=update_mask
+                    update_mask=update_mask,
+                    aspect_keys=[draft_aspect_name]
                 )
                 
                 updated_entry = client.update_entry(request=request)
+                self._client._dataplex_ops._invalidate_cached_entry(entry.name)
                 return {"success": True, "message": f"Table {table_fqn} description updated"}
                 
             elif item_type == "column":
@@ -866,10 +940,12 @@ class ReviewOperations:
                 update_mask = field_mask_pb2.FieldMask(paths=["aspects"])
                 request = dataplex_v1.UpdateEntryRequest(
                     entry=entry,
-                    update_mask=update_mask
+                    update_mask=update_mask,
+                    aspect_keys=[draft_aspect_name]
                 )
                 
                 updated_entry = client.update_entry(request=request)
+                self._client._dataplex_ops._invalidate_cached_entry(entry.name)
                 return {"success": True, "message": f"Column {column_name} in table {table_fqn} description updated"}
             else:
                 raise ValueError(f"Unknown item type: {item_type}")
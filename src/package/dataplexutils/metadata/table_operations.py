@@ -20,7 +20,12 @@ limitations under the License.
 import logging
 import toml
 import pkgutil
+import csv
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 # Cloud imports
 from google.cloud import storage
@@ -36,12 +41,46 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Dataset-level generation submits at most this many tables to the thread pool at a time
+_WORKERS_BATCH_SIZE = 200
+# Dataplex search returns at most this many entries per page
+_SEARCH_PAGE_SIZE = 1000
+_BIGQUERY_FQN_PREFIX = "bigquery:"
+_BIGQUERY_FQN_PREFIX_LENGTH = len(_BIGQUERY_FQN_PREFIX)
+# Documentation CSVs are read by several strategy branches, so downloads are reused for this long
+_DOCUMENTATION_CSV_CACHE_TTL_SECONDS = 300
+
+_NAIVE = constants["GENERATION_STRATEGY"]["NAIVE"]
+_DOCUMENTED = constants["GENERATION_STRATEGY"]["DOCUMENTED"]
+_DOCUMENTED_THEN_REST = constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]
+_RANDOM = constants["GENERATION_STRATEGY"]["RANDOM"]
+_ALPHABETICAL = constants["GENERATION_STRATEGY"]["ALPHABETICAL"]
+
+def _shuffled(tables):
+    """Returns a shuffled copy of a list of tables."""
+    return random.sample(tables, k=len(tables))
+
+# Orderings applied by _order_tables_to_strategy; other strategies keep the listed order
+_TABLE_ORDERINGS = {
+    _RANDOM: _shuffled,
+    _ALPHABETICAL: sorted,
+}
+
 class TableOperations:
     """Table-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._storage_client = None
+        self._documentation_csv_cache = {}
+        self._documentation_csv_cache_lock = threading.Lock()
+
+    def _get_storage_client(self):
+        """Returns the storage client, creating it on first use."""
+        if self._storage_client is None:
+            self._storage_client = storage.Client()
+        return self._storage_client
 
     def regenerate_dataset_tables_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         """Regenerates metadata on the tables of a whole dataset."""
@@ -80,66 +119,114 @@ class TableOperations:
             if int_strategy not in constants["GENERATION_STRATEGY"].values():
                 raise ValueError(f"Invalid strategy: {strategy}.")
             
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            if int_strategy == _DOCUMENTED:
                 if documentation_csv_uri is None:
                     raise ValueError("A documentation URI is required for the DOCUMENTED strategy.")
 
             if self._client._client_options._regenerate:
                 tables = self._list_tables_in_dataset_for_regeneration(dataset_fqn)
-                logger.debug(f"Tables to regenerate: {tables}")
+                logger.debug("Tables to regenerate: %s", tables)
             else:
                 tables = self._list_tables_in_dataset(dataset_fqn)
-                logger.debug(f"Tables to generate: {tables}")
+                logger.debug("Tables to generate: %s", tables)
+            # Membership checks against the documentation CSV use sets; tables keeps the listing order
+            tables_set = set(tables)
                 
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            # (table_fqn, documentation_uri) of every table to describe, in order
+            tables_to_generate = []
+
+            if int_strategy == _DOCUMENTED:
                 tables_from_uri = self._get_tables_from_uri(documentation_csv_uri)
                 if not self._client._client_options._regenerate:
                     for table in tables_from_uri:
-                        if table[0] not in tables:
+                        if table[0] not in tables_set:
                             raise ValueError(f"Table {table} not found in dataset {dataset_fqn}.")
-                        self.generate_table_description(table[0], table[1])
+                        tables_to_generate.append((table[0], table[1]))
                 if self._client._client_options._regenerate:
-                    tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
+                    tables_from_uri_first_elements = {table[0] for table in tables_from_uri}
                     for table in tables:
-                        if self._check_if_table_should_be_regenerated(table):
+                        if self._client._dataplex_ops.check_if_table_should_be_regenerated(table):
                             if table not in tables_from_uri_first_elements:
                                 raise ValueError(f"Table {table} not found in documentation")
-                            self.generate_table_description(table)
+                            tables_to_generate.append((table, None))
 
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]:
+            if int_strategy == _DOCUMENTED_THEN_REST:
                 tables_from_uri = self._get_tables_from_uri(documentation_csv_uri)
                 if not self._client._client_options._regenerate:
                     for table in tables_from_uri:
-                        if table not in tables:
+                        if table[0] not in tables_set:
                             raise ValueError(f"Table {table} not found in dataset {dataset_fqn}.")
-                        self.generate_table_description(table[0], table[1])
-                tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
+                        tables_to_generate.append((table[0], table[1]))
+                tables_from_uri_first_elements = {table[0] for table in tables_from_uri}
                 if self._client._client_options._regenerate:
                     for table in tables:
-                        if self._check_if_table_should_be_regenerated(table):
+                        if self._client._dataplex_ops.check_if_table_should_be_regenerated(table):
                             if table not in tables_from_uri_first_elements:
                                 raise ValueError(f"Table {table} not found in documentation")
-                            self.generate_table_description(table)
+                            tables_to_generate.append((table, None))
                 for table in tables:
                     if table not in tables_from_uri_first_elements:
-                        self.generate_table_description(table)
+                        tables_to_generate.append((table, None))
             
-            if int_strategy in [constants["GENERATION_STRATEGY"]["NAIVE"], constants["GENERATION_STRATEGY"]["RANDOM"], constants["GENERATION_STRATEGY"]["ALPHABETICAL"]]:
+            if int_strategy in (_NAIVE, _RANDOM, _ALPHABETICAL):
                 tables_sorted = self._order_tables_to_strategy(tables, int_strategy)
-                for table in tables_sorted:
-                    self.generate_table_description(table)
+                tables_to_generate.extend((table, None) for table in tables_sorted)
+
+            tables_metadata = self._prefetch_tables_metadata([table_fqn for table_fqn, _ in tables_to_generate])
+            self._generate_tables_descriptions(tables_to_generate, tables_metadata)
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
-    def generate_table_description(self, table_fqn, documentation_uri=None, human_comments=None):
+    def _generate_tables_descriptions(self, tables, tables_metadata=None):
+        """Generates the descriptions of several tables concurrently.
+
+        Tables are submitted in order, in batches of _WORKERS_BATCH_SIZE, to a pool of
+        max_workers threads (see ClientOptions). The options are only read by the
+        workers, so they need no locking; the aspect type is created up front.
+
+        The run fails fast: on the first table error, the tables still queued are
+        cancelled, the ones already running finish, later batches are skipped and
+        the error is raised.
+
+        Args:
+            tables (list): Tuples of (table_fqn, documentation_uri)
+            tables_metadata (dict, optional): Prefetched metadata bundles, by table_fqn
+
+        Raises:
+            Exception: The first error raised while generating a table
+        """
+        # Create the draft aspect type once, before the workers need it
+        if tables and self._client._client_options._stage_for_review:
+            self._client._dataplex_ops._ensure_aspect_type(constants["ASPECT_TEMPLATE"]["name"])
+        tables_metadata = tables_metadata or {}
+        executor = ThreadPoolExecutor(max_workers=self._client._client_options._max_workers)
+        try:
+            for batch_start in range(0, len(tables), _WORKERS_BATCH_SIZE):
+                futures = [
+                    executor.submit(
+                        self.generate_table_description, table_fqn, documentation_uri,
+                        table_metadata=tables_metadata.get(table_fqn)
+                    )
+                    for table_fqn, documentation_uri in tables[batch_start:batch_start + _WORKERS_BATCH_SIZE]
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        except Exception:
+            # Fail fast: tables not started yet are dropped, only running ones finish
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+    def generate_table_description(self, table_fqn, documentation_uri=None, human_comments=None, table_metadata=None):
         """Generates metadata for a table.
 
         Args:
             table_fqn: The fully qualified name of the table
             documentation_uri: Optional URI to documentation
             human_comments: Optional human comments to consider
+            table_metadata: Optional prefetched quality, profile and lineage bundle
 
         Returns:
             str: Success message if description was generated
@@ -147,49 +234,42 @@ class TableOperations:
         Raises:
             NotFound: If the specified table does not exist.
         """
-        logger.info(f"Generating metadata for table {table_fqn}.")
+        logger.info("Generating metadata for table %s.", table_fqn)
         
         self._client._bigquery_ops.table_exists(table_fqn)
+        # These reads run inline: the table and its Dataplex metadata are usually
+        # cached or prefetched already, and dataset runs parallelize across tables.
+        # The schema and sample are required, so their errors fail the table; the
+        # Dataplex metadata and human comments are optional and fall back to None.
         # Get base information
-        logger.info(f"Getting schema for table {table_fqn}.")
+        logger.info("Getting schema and sample for table %s.", table_fqn)
         table_schema_str, _ = self._client._bigquery_ops.get_table_schema(table_fqn)
-        logger.info(f"Getting sample for table {table_fqn}.")
         table_sample = self._client._bigquery_ops.get_table_sample(
             table_fqn, constants["DATA"]["NUM_ROWS_TO_SAMPLE"]
         )
-        # Get additional information
-        logger.info(f"Getting table quality for table {table_fqn}.")
-        table_quality = self._get_table_quality(
-            self._client._client_options._use_data_quality, table_fqn
-        )
-        logger.info(f"Getting table profile for table {table_fqn}.")
-        table_profile = self._get_table_profile(
-            self._client._client_options._use_profile, table_fqn
-        )
-        try:
-            logger.info(f"Getting source tables for table {table_fqn}.")
-            table_sources_info = self._get_table_sources_info(
-                self._client._client_options._use_lineage_tables, table_fqn
-            )
-        except Exception as e:
-            logger.error(f"Error getting table sources info for table {table_fqn}: {e}")
-            table_sources_info = None
-        try:
-            logger.info(f"Getting jobs calculating for table {table_fqn}.")
-            job_sources_info = self._get_job_sources(
-                self._client._client_options._use_lineage_processes, table_fqn
-            )
-        except Exception as e:
-            logger.error(f"Error getting job sources info for table {table_fqn}: {e}")
-            job_sources_info = None
+        # Get additional information: quality, profile, source tables and jobs in one lookup
+        if table_metadata is None:
+            logger.info("Getting quality, profile and lineage for table %s.", table_fqn)
+            try:
+                table_metadata = self._get_table_metadata_bundle(table_fqn)
+            except Exception as e:
+                logger.warning("Could not get quality, profile and lineage for table %s: %s", table_fqn, e)
+                table_metadata = dict.fromkeys(("quality", "profile", "table_sources", "job_sources"))
+        # Get human comments if enabled
+        if self._client._client_options._use_human_comments and human_comments is None:
+            logger.info("Getting human comments for table %s.", table_fqn)
+            try:
+                human_comments = self._client._dataplex_ops.get_table_comment(table_fqn)
+            except Exception as e:
+                logger.warning("Could not get human comments for table %s: %s", table_fqn, e)
+
+        table_quality = table_metadata["quality"]
+        table_profile = table_metadata["profile"]
+        table_sources_info = table_metadata["table_sources"]
+        job_sources_info = table_metadata["job_sources"]
 
         if documentation_uri == "":
             documentation_uri = None
-            
-        # Get human comments if enabled
-        if self._client._client_options._use_human_comments and human_comments is None:
-            logger.info(f"Getting human comments for table {table_fqn}.")
-            human_comments = self._client._dataplex_ops.get_table_comment(table_fqn)
 
         # Get prompt
         prompt_manager = PromptManager(
@@ -219,20 +299,17 @@ class TableOperations:
             self._client._bigquery_ops.update_table_description(table_fqn, table_description)
             if self._client._client_options._persist_to_dataplex_catalog:
                 self._client._dataplex_ops.update_table_dataplex_description(table_fqn, table_description)
-                logger.info(f"Table description updated for table {table_fqn} in Dataplex catalog")
+                logger.info("Table description updated for table %s in Dataplex catalog", table_fqn)
             
         else:
             # If we are staging for review, we update the table in Dataplex catalog
-            if not self._client._dataplex_ops._check_if_exists_aspect_type(constants["ASPECT_TEMPLATE"]["name"]):
-                logger.info(f"Aspect type {constants['ASPECT_TEMPLATE']['name']} not exists. Attempting to create it")
-                self._client._dataplex_ops._create_aspect_type(constants["ASPECT_TEMPLATE"]["name"])
-                logger.info(f"Aspect type {constants['ASPECT_TEMPLATE']['name']} created")
+            self._client._dataplex_ops._ensure_aspect_type(constants["ASPECT_TEMPLATE"]["name"])
             self._client._dataplex_ops.update_table_draft_description(table_fqn, table_description)
-            logger.info(f"Table {table_fqn} will not be updated in BigQuery.")
+            logger.info("Table %s will not be updated in BigQuery.", table_fqn)
         # If we were regenerating a table, we mark it as regerated
         if self._client._client_options._regenerate:
             self._client._dataplex_ops.mark_table_as_regenerated(table_fqn)
-            logger.info(f"Table {table_fqn} marked as regenerated")
+            logger.info("Table %s marked as regenerated", table_fqn)
         return {
             "status": "success",
             "message": "Table description generated successfully",
@@ -246,39 +323,45 @@ class TableOperations:
     def _get_tables_from_uri(self, documentation_csv_uri):
         """Reads the CSV file from Google Cloud Storage and returns the tables.
 
+        Files read in the last _DOCUMENTATION_CSV_CACHE_TTL_SECONDS are served from memory.
+
         Args:
             documentation_csv_uri: The URI of the CSV file in Google Cloud Storage.
 
         Returns:
-            A list of tables.
+            A list of tables. The list is shared between callers and must not be mutated.
 
         Raises:
+            ValueError: If the URI is not a gs://bucket/path URI.
             Exception: If there is an error reading the CSV file.
         """
-        try:
-            # Create a client to interact with Google Cloud Storage
-            storage_client = storage.Client()
-
-            # Get the bucket and blob names from the URI
-            bucket_name, blob_name = documentation_csv_uri.split("/", 3)[2:]
-
-            # Get the bucket and blob objects
-            bucket = storage_client.get_bucket(bucket_name)
-            blob = bucket.blob(blob_name)
+        now = time.monotonic()
+        with self._documentation_csv_cache_lock:
+            cached = self._documentation_csv_cache.get(documentation_csv_uri)
+        if cached is not None and cached[0] > now:
+            return cached[1]
 
-            # Download the CSV file as a string
-            csv_data = blob.download_as_text()
-
-            # Split the CSV data into lines
-            lines = csv_data.split("\n")
-
-            # Remove any empty lines
-            lines = [line for line in lines if line.strip()]
-
-            # Extract the table names from the lines
-            tables = [(line.split(",")[0], line.split(",")[1].strip()) for line in lines]
-            for table in tables:
-                logger.info(f"Table: {table[0]} doc: {table[1]}")
+        try:
+            # Get the bucket and blob names from the gs://bucket/path URI
+            parsed_uri = urlparse(documentation_csv_uri)
+            bucket_name, blob_name = parsed_uri.netloc, parsed_uri.path.lstrip("/")
+            if parsed_uri.scheme != "gs" or not bucket_name or not blob_name:
+                raise ValueError(f"Invalid documentation URI: {documentation_csv_uri}. Expected gs://bucket/path.")
+
+            # bucket() only builds a reference; get_bucket() would fetch the bucket metadata first
+            blob = self._get_storage_client().bucket(bucket_name).blob(blob_name)
+
+            # Stream the CSV file and read the table and documentation URI of each
+            # non-empty row
+            with blob.open("rt", newline="") as csv_file:
+                tables = [
+                    (row[0], row[1].strip())
+                    for row in csv.reader(csv_file)
+                    if any(field.strip() for field in row)
+                ]
+            logger.info("Read %d documented tables from %s", len(tables), documentation_csv_uri)
+            with self._documentation_csv_cache_lock:
+                self._documentation_csv_cache[documentation_csv_uri] = (now + _DOCUMENTATION_CSV_CACHE_TTL_SECONDS, tables)
             return tables
         except Exception as e:
             logger.error(f"Exception: {e}.")
@@ -294,16 +377,8 @@ class TableOperations:
         Returns:
             Ordered list of table names
         """
-        if strategy == constants["GENERATION_STRATEGY"]["NAIVE"]:
-            return tables
-        elif strategy == constants["GENERATION_STRATEGY"]["RANDOM"]:
-            tables_copy = tables.copy()
-            random.shuffle(tables_copy)
-            return tables_copy
-        elif strategy == constants["GENERATION_STRATEGY"]["ALPHABETICAL"]:
-            return sorted(tables)
-        else:
-            return tables
+        ordering = _TABLE_ORDERINGS.get(strategy)
+        return ordering(tables) if ordering else tables
 
     def _list_tables_in_dataset(self, dataset_fqn):
         """Lists all tables in a given dataset.
@@ -336,18 +411,21 @@ class TableOperations:
             query = f"""system=BIGQUERY AND parent:{project_id}.{dataset_id} and aspect:global.{constants['ASPECT_TEMPLATE']['name']}.to-be-regenerated=true"""
             logger.info(f"Query: {query}")
             
+            # The largest page size search accepts, to keep round trips low on big datasets
             request = dataplex_v1.SearchEntriesRequest(
                 name=name,
-                query=query
+                query=query,
+                page_size=_SEARCH_PAGE_SIZE
             )
             
             table_names = []
             try:
                 search_results = client.search_entries(request=request)
-                for result in search_results:
-                    if result.dataplex_entry.fully_qualified_name.startswith("bigquery:"):
-                        table_fqn = result.dataplex_entry.fully_qualified_name.replace("bigquery:", "")
-                        table_names.append(table_fqn)
+                for page in search_results.pages:
+                    fqns = [result.dataplex_entry.fully_qualified_name for result in page.results]
+                    table_names.extend(
+                        fqn[_BIGQUERY_FQN_PREFIX_LENGTH:] for fqn in fqns if fqn.startswith(_BIGQUERY_FQN_PREFIX)
+                    )
                 return table_names
             except google.api_core.exceptions.PermissionDenied:
                 logger.warning(f"Permission denied when searching for tables in dataset {dataset_fqn}")
@@ -357,6 +435,47 @@ class TableOperations:
             logger.error(f"Error listing tables in dataset {dataset_fqn}: {e}")
             raise e 
 
+    def _prefetch_tables_metadata(self, table_fqns):
+        """Reads the quality, profile and lineage of many tables ahead of their generation.
+
+        The reads run concurrently and the bundles are returned to be handed to the
+        generation of each table. They are not left to the Dataplex operations cache,
+        which is bounded and would evict them before a large dataset is done.
+
+        Args:
+            table_fqns (list): The fully qualified names of the tables
+
+        Returns:
+            dict: The bundle of each table (see _get_table_metadata_bundle), by table_fqn
+        """
+        client_options = self._client._client_options
+        return self._client._dataplex_ops.get_tables_metadata_bundles(
+            table_fqns,
+            use_data_quality=client_options._use_data_quality,
+            use_profile=client_options._use_profile,
+            use_lineage_tables=client_options._use_lineage_tables,
+            use_lineage_processes=client_options._use_lineage_processes,
+            max_workers=client_options._max_workers,
+        )
+
+    def _get_table_metadata_bundle(self, table_fqn):
+        """Gets the quality, profile and lineage information enabled in the client options.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            dict: The keys 'quality', 'profile', 'table_sources' and 'job_sources'
+        """
+        client_options = self._client._client_options
+        return self._client._dataplex_ops.get_table_metadata_bundle(
+            table_fqn,
+            use_data_quality=client_options._use_data_quality,
+            use_profile=client_options._use_profile,
+            use_lineage_tables=client_options._use_lineage_tables,
+            use_lineage_processes=client_options._use_lineage_processes,
+        )
+
     def _get_table_quality(self, use_data_quality, table_fqn):
         """Gets the quality information for a table.
 
@@ -397,7 +516,7 @@ class TableOperations:
         """
         if not use_lineage_tables:
             return None
-        return self._client._dataplex_ops.get_table_sources_info(use_lineage_tables, table_fqn)
+        return self._get_table_lineage(table_fqn)["table_sources"]
 
     def _get_job_sources(self, use_lineage_processes, table_fqn):
         """Gets the job source information.
@@ -411,4 +530,25 @@ class TableOperations:
         """
         if not use_lineage_processes:
             return None
-        return self._client._dataplex_ops.get_job_sources(use_lineage_processes, table_fqn) 
\ No newline at end of file
+        return self._get_table_lineage(table_fqn)["job_sources"]
+
+    def _get_table_lineage(self, table_fqn):
+        """Gets the source tables and jobs enabled in the client options with one lookup.
+
+        Both lineage aspects are read by a single GetEntry and kept in the Dataplex
+        operations cache, so _get_table_sources_info and _get_job_sources share it.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            dict: The keys 'table_sources' and 'job_sources'
+        """
+        client_options = self._client._client_options
+        return self._client._dataplex_ops.get_table_metadata_bundle(
+            table_fqn,
+            use_data_quality=False,
+            use_profile=False,
+            use_lineage_tables=client_options._use_lineage_tables,
+            use_lineage_processes=client_options._use_lineage_processes,
+        ) 
\ No newline at end of file
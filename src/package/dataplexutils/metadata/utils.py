@@ -18,10 +18,12 @@ limitations under the License.
 """
 # Standard library imports
 import re
+import functools
 import logging
 import toml
 import pkgutil
 import time
+import orjson
 
 # Cloud imports
 import vertexai
@@ -34,6 +36,47 @@ constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+_TABLE_FQN_PATTERN = re.compile(r"^([^.]+)[\.:]([^.]+)\.([^.]+)")
+_DATASET_FQN_PATTERN = re.compile(r"^([^.]+)\.([^.]+)")
+
+
+def _parse_llm_json(text):
+    """Parses a JSON object from an LLM response.
+
+    The model often wraps its answer in markdown fences or adds text around
+    it, so when the whole response is not valid JSON the outermost {...}
+    block is parsed instead.
+
+    Returns:
+        The parsed JSON, or the raw text if no JSON object could be parsed
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            return orjson.loads(text[start:end + 1])
+        except orjson.JSONDecodeError:
+            pass
+    logger.warning("LLM response is not valid JSON: %s", text)
+    return text
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_table_fqn(table_fqn):
+    match = _TABLE_FQN_PATTERN.search(table_fqn)
+    return match.group(1), match.group(2), match.group(3)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_dataset_fqn(dataset_fqn):
+    match = _DATASET_FQN_PATTERN.search(dataset_fqn)
+    return match.group(1), match.group(2)
+
+
 class MetadataUtils:
     """Utility functions for metadata operations."""
 
@@ -55,11 +98,8 @@ class MetadataUtils:
             Exception: If the table FQN cannot be parsed correctly
         """
         try:
-            pattern = r"^([^.]+)[\.:]([^.]+)\.([^.]+)"
-            logger.debug(f"Splitting table FQN: {table_fqn}.")
-            match = re.search(pattern, table_fqn)
-            logger.debug(f"Found 3 groups: {match.group(1)} {match.group(2)} {match.group(3)}")
-            return match.group(1), match.group(2), match.group(3)
+            # Results are cached since the same FQNs are split on every Dataplex call
+            return _split_table_fqn(table_fqn)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
@@ -78,9 +118,8 @@ class MetadataUtils:
             Exception: If the dataset FQN cannot be parsed correctly
         """
         try:
-            pattern = r"^([^.]+)\.([^.]+)"
-            match = re.search(pattern, dataset_fqn)
-            return match.group(1), match.group(2)
+            # Results are cached like table FQNs
+            return _split_dataset_fqn(dataset_fqn)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
@@ -208,7 +247,8 @@ class MetadataUtils:
             documentation_uri (str, optional): URI of documentation to include
 
         Returns:
-            str: The generated text response
+            dict: The validation result parsed from the JSON response, or the
+            raw response text if it is not valid JSON
         """
         retries = 3
         base_delay = 1
@@ -250,11 +290,13 @@ class MetadataUtils:
                         generation_config=generation_config,
                         stream=False,
                 )
-                return responses.text
+                response_text = responses.text
+                break
             except Exception as e:
                 if attempt == retries:
                     logger.error(f"Exception: {e}.")
                     raise e
                 else:
                     # Exponential backoff - wait longer between each retry attempt
-                    time.sleep(base_delay * (2 ** attempt))
\ No newline at end of file
+                    time.sleep(base_delay * (2 ** attempt))
+        return _parse_llm_json(response_text)
\ No newline at end of file